@@ -0,0 +1,25 @@
+# compile a l'avance (AOT) le calcul de la grille de main.py avec numba
+# a lancer une seule fois : python build_aot.py
+# ca cree voronoi_aot.*.so a cote de main.py, et main.py l'utilise en priorite
+# comme ca l'appli n'a plus a attendre la compilation JIT au premier "Charger"
+import os
+
+from numba.pycc import CC
+
+import main
+
+if main._voronoi_kernel is None:
+    raise SystemExit("numba n'est pas installe, impossible de compiler le module")
+
+cc = CC('voronoi_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# on reprend exactement le code du noyau JIT (py_func = la fonction python d'origine)
+# une version par type de grille (int16 jusqu'a 32767 points, int32 au dela)
+noyau = main._voronoi_kernel.py_func
+cc.export('voronoi_kernel_i16', 'void(f4[::1], f4[::1], i2[:, ::1])')(noyau)
+cc.export('voronoi_kernel_i32', 'void(f4[::1], f4[::1], i4[:, ::1])')(noyau)
+
+if __name__ == "__main__":
+    cc.compile()
+    print("✓ module voronoi_aot compilé")
@@ -1,12 +1,43 @@
 import numpy as np      
 import matplotlib.pyplot as plt
-import math 
+import os
 import tkinter as tk
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 from tkinter import filedialog
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+# numba est optionnel : s'il est installe on compile le calcul de la grille,
+# sinon on garde la version numpy
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# version deja compilee du noyau (creee par build_aot.py), elle evite d'attendre
+# la compilation numba au premier lancement. ordre : AOT, puis JIT, puis numpy
+try:
+    import voronoi_aot
+except ImportError:
+    voronoi_aot = None
+
 def lire_coordonnees(nom_fichier):
-    """Lit un fichier texte et retourne une liste de points."""
+    """Lit un fichier texte et retourne un tableau numpy (N, 2) de points."""
+    # numpy lit tout le fichier d'un coup (en C), c'est beaucoup plus rapide que notre boucle
+    # si le fichier est un peu sale (lignes vides, lignes en trop...) on repasse par la boucle
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # numpy previent quand le fichier est vide
+            points = np.loadtxt(nom_fichier, delimiter=',', dtype=np.float32, comments=None, ndmin=2)
+        if points.shape[1] == 2:
+            return points
+    except FileNotFoundError:
+        print(f"Attention: Ton fichier {nom_fichier} n'a pas été trouvé !")
+        return np.empty((0, 2), dtype=np.float32)
+    except ValueError:
+        pass
+    
     points = []
     try:
         with open(nom_fichier, 'r') as fichier:
@@ -16,17 +47,9 @@ def lire_coordonnees(nom_fichier):
                     points.append((float(valeurs[0]), float(valeurs[1]))) # On met toutes les valeurs en FLOAT.
     except FileNotFoundError: # Si le fichier est pas trouvé on envoie un message d'erreur à l'utilisateur
         print(f"Attention: Ton fichier {nom_fichier} n'a pas été trouvé !")
-    return points
-
-def calculer_distance(point1, point2):
-    x1 = point1[0]
-    y1 = point1[1]
-    x2 = point2[0]
-    y2 = point2[1]
-    
-    distance = math.sqrt((x2 - x1)**2 + (y2 - y1)**2) # On calcule la distance Euclidienne point 1 et point 2 
-    
-    return distance
+    # on convertit une seule fois en tableau numpy (float32 suffit largement pour des pixels)
+    # comme ca tout le reste du programme travaille sur un tableau contigu et pas sur des tuples
+    return np.asarray(points, dtype=np.float32).reshape(-1, 2)
 
 def trouver_point_plus_proche(pixel_x, pixel_y, liste_points):
     # on part avec une distance infinie pour etre sur que le premier point sera forcement plus proche
@@ -35,7 +58,11 @@ def trouver_point_plus_proche(pixel_x, pixel_y, liste_points):
     
     for index in range(len(liste_points)):
         point = liste_points[index]
-        distance = calculer_distance((pixel_x, pixel_y), point)
+        # pas besoin de la racine carree : si une distance est plus petite,
+        # son carre l'est aussi, donc on compare directement les carres
+        dx = point[0] - pixel_x
+        dy = point[1] - pixel_y
+        distance = dx * dx + dy * dy
 
         # si on trouve un point plus proche on met a jour
         if distance < distance_min:
@@ -44,53 +71,160 @@ def trouver_point_plus_proche(pixel_x, pixel_y, liste_points):
             
     return index_du_plus_proche
 
+# marge (en pixels) ajoutee autour du point le plus loin pour pas qu'il soit colle au bord
+MARGE_GRILLE = 10
+
+# taille max (en octets) du tableau des distances calcule d'un coup
+# au dela on decoupe la grille en bandes de lignes sinon ca prend toute la RAM
+TAILLE_MAX_BLOC = 64 * 1024 * 1024
+
+# au dela de ce nombre de calculs (pixels x points) la version numpy repartit
+# les bandes de lignes sur plusieurs processus (en dessous ca coute plus cher que ca rapporte)
+SEUIL_PARALLELE = 50_000_000
+
+_voronoi_kernel = None
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _voronoi_kernel(pts_x, pts_y, grille):
+        # chaque ligne est traitee par un coeur (prange) et on garde juste le meilleur
+        # point au fur et a mesure, le resultat est ecrit directement dans grille
+        # (deja allouee avec le bon type)
+        # les points sont tries par x : pour un pixel on part du point le plus proche
+        # en x puis on s'eloigne a gauche et a droite, et des que dx*dx depasse la
+        # meilleure distance on peut s'arreter, tous les points suivants sont plus loin
+        H, W = grille.shape
+        n = pts_x.shape[0]
+        ordre = np.argsort(pts_x)
+        sx = pts_x[ordre]
+        sy = pts_y[ordre]
+        for y in prange(H):
+            p = 0  # premier point avec sx >= x, il ne fait qu'avancer le long de la ligne
+            for x in range(W):
+                while p < n - 1 and sx[p] < x:
+                    p += 1
+                dx = x - sx[p]
+                dy = y - sy[p]
+                best = dx * dx + dy * dy
+                idx = ordre[p]
+                # a distance egale on garde le plus petit numero, comme la force brute
+                k = p - 1
+                while k >= 0:
+                    dx = x - sx[k]
+                    if dx * dx > best:
+                        break
+                    dy = y - sy[k]
+                    d = dx * dx + dy * dy
+                    if d < best or (d == best and ordre[k] < idx):
+                        best = d
+                        idx = ordre[k]
+                    k -= 1
+                k = p + 1
+                while k < n:
+                    dx = x - sx[k]
+                    if dx * dx > best:
+                        break
+                    dy = y - sy[k]
+                    d = dx * dx + dy * dy
+                    if d < best or (d == best and ordre[k] < idx):
+                        best = d
+                        idx = ordre[k]
+                    k += 1
+                grille[y, x] = idx
+
+def _calculer_bande(args):
+    # fonction executee dans un processus a part : calcule les lignes y0 a y1 de la grille
+    # les points sont lus dans une memoire partagee, comme ca on ne les copie pas pour chaque bande
+    y0, y1, nom_memoire, nb_points, largeur = args
+    memoire = shared_memory.SharedMemory(name=nom_memoire)
+    pts = np.ndarray((nb_points, 2), dtype=np.float32, buffer=memoire.buf)
+    xs = np.arange(largeur, dtype=np.float32)
+    ys = np.arange(y0, y1, dtype=np.float32)
+    dist_sq = ((xs[None, None, :] - pts[:, 0, None, None])**2
+               + (ys[None, :, None] - pts[:, 1, None, None])**2)
+    bande = np.argmin(dist_sq, axis=0)
+    del pts  # il faut lacher la vue sur la memoire avant de la fermer
+    memoire.close()
+    return bande
+
 def generer_grille(mes_points):
     """Génère la grille de Voronoi"""
-    if not mes_points:
+    if len(mes_points) == 0:
         print("Erreur: pas de points!")
         return None, None
     
-    # on cherche la valeur max parmi tous les x et y pour savoir quelle taille faire la grille
-    taille_max = 0
-    for point in mes_points:
-        if point[0] > taille_max:
-            taille_max = int(point[0])
-        if point[1] > taille_max:
-            taille_max = int(point[1])
+    pts = np.asarray(mes_points, dtype=np.float32)
     
-    taille_max = taille_max + 10  # on ajoute 10 pour avoir un peu de marge sur les bords
+    # la plus grande coordonnee (x ou y) donne la taille de la grille, en un seul appel numpy
+    # ceil pour que le point le plus loin tombe bien dans la grille meme s'il a des decimales
+    taille_max = max(int(np.ceil(pts.max())), 0) + MARGE_GRILLE
     
-    grille = np.zeros((taille_max, taille_max)) # grille remplie de 0 au depart
+    # la grille contient juste des numeros de points, pas besoin de 8 octets par pixel :
+    # int16 suffit jusqu'a 32767 points (sinon on passe en int32)
+    type_grille = np.int16 if len(pts) <= 32767 else np.int32
+    grille = np.zeros((taille_max, taille_max), dtype=type_grille) # grille remplie de 0 au depart
     
-    # pour chaque pixel de la grille on regarde quel point est le plus proche
-    # c'est l'algorithme force brute, c'est pas le plus rapide mais c'est simple a comprendre
-    for y in range(taille_max):
-        for x in range(taille_max):
-            grille[y, x] = trouver_point_plus_proche(x, y, mes_points)
+    if voronoi_aot is not None:
+        noyau = voronoi_aot.voronoi_kernel_i16 if type_grille == np.int16 else voronoi_aot.voronoi_kernel_i32
+        noyau(pts[:, 0].copy(), pts[:, 1].copy(), grille)
+        return grille, taille_max
+    
+    if _voronoi_kernel is not None:
+        _voronoi_kernel(pts[:, 0].copy(), pts[:, 1].copy(), grille)
+        return grille, taille_max
+    
+    xs = np.arange(taille_max, dtype=np.float32)
+    ys = np.arange(taille_max, dtype=np.float32)
+    
+    # au lieu de faire une double boucle sur les pixels, numpy calcule d'un coup la distance
+    # (au carre, pas besoin de racine pour trouver le min) de chaque pixel a chaque point
+    # et argmin donne l'indice du point le plus proche
+    nb_lignes = max(1, TAILLE_MAX_BLOC // (len(pts) * taille_max * 4))
+    
+    # grosse grille : chaque processus calcule quelques bandes de lignes en parallele
+    if len(pts) * taille_max * taille_max > SEUIL_PARALLELE:
+        nb_lignes = min(nb_lignes, -(-taille_max // (os.cpu_count() or 1)))
+        bandes = [(y0, min(y0 + nb_lignes, taille_max)) for y0 in range(0, taille_max, nb_lignes)]
+        memoire = shared_memory.SharedMemory(create=True, size=pts.nbytes)
+        try:
+            np.ndarray(pts.shape, dtype=np.float32, buffer=memoire.buf)[:] = pts
+            taches = [(y0, y1, memoire.name, len(pts), taille_max) for y0, y1 in bandes]
+            with ProcessPoolExecutor() as pool:
+                for (y0, y1), bande in zip(bandes, pool.map(_calculer_bande, taches)):
+                    grille[y0:y1] = bande
+        finally:
+            memoire.close()
+            memoire.unlink()
+        return grille, taille_max
+    
+    for y0 in range(0, taille_max, nb_lignes):
+        y1 = min(y0 + nb_lignes, taille_max)
+        dist_sq = ((xs[None, None, :] - pts[:, 0, None, None])**2
+                   + (ys[None, y0:y1, None] - pts[:, 1, None, None])**2)
+        grille[y0:y1] = np.argmin(dist_sq, axis=0)
     
     return grille, taille_max
 
 
+def grille_en_rgb(grille, nb_points):
+    """Transforme la grille d'indices en image RGB (uint8) avec la palette viridis"""
+    # on applique la palette une seule fois ici, comme ca matplotlib n'a plus
+    # a refaire la conversion couleur a chaque affichage ou a chaque export
+    couleurs = plt.cm.viridis(grille / max(nb_points - 1, 1))[..., :3]
+    return (couleurs * 255).astype(np.uint8)
+
+
 # on a factorise les deux fonctions export en une seule
 # avant on avait exporter_png et exporter_svg qui faisaient quasiment la meme chose
 # la seule difference c'est le format donc on le passe en parametre
-def exporter_diagramme(grille, mes_points, taille_max, nom_fichier, format):
-    """Exporte le diagramme dans le format demandé (png ou svg)"""
-    plt.figure(figsize=(10, 10))
-    plt.imshow(grille, origin="lower")
-    
-    for point in mes_points:
-        plt.scatter(point[0], point[1], color='red', s=100)
-    
-    plt.title(f"Voronoi ({len(mes_points)} points)")
-    
+# maintenant on ne redessine plus rien : on sauvegarde directement la figure deja affichee
+def exporter_diagramme(fig, nom_fichier, format):
+    """Exporte la figure du diagramme dans le format demandé (png ou svg)"""
     # savefig gere les deux formats, on lui passe juste le bon nom de fichier
     if format == 'png':
-        plt.savefig(nom_fichier, dpi=150)
+        fig.savefig(nom_fichier, dpi=150)
     else:
-        plt.savefig(nom_fichier, format='svg')
+        fig.savefig(nom_fichier, format='svg')
     
-    plt.close()
     print(f"✓ {format.upper()} exporté: {nom_fichier}")
 
 #  INTERFACE GRAPHIQUE AVEC TKINTER
@@ -98,9 +232,11 @@ def exporter_diagramme(grille, mes_points, taille_max, nom_fichier, format):
 class AppVoronoi:
     def __init__(self):
         # On initialise les variables dont on aura besoin dans toute l'appli
-        self.mes_points = []   # contiendra les points lus depuis le fichier
+        self.mes_points = np.empty((0, 2), dtype=np.float32)   # contiendra les points lus depuis le fichier
         self.grille = None     # la grille voronoi generee
+        self.image_rgb = None  # la grille deja convertie en couleurs
         self.taille_max = None # taille de la grille
+        self.fig = None        # la figure affichee, reutilisee pour les exports
         
         # Creation de la fenetre principale
         self.fenetre = tk.Tk()
@@ -129,13 +265,14 @@ class AppVoronoi:
         fichier = filedialog.askopenfilename(filetypes=[("Texte", "*.txt")])
         if fichier:
             self.mes_points = lire_coordonnees(fichier)
-            if self.mes_points:
+            if len(self.mes_points) > 0:
                 # On previent l'utilisateur que ca calcule
                 self.label.config(text="en cours...", fg="orange")
                 self.fenetre.update() # important sinon le label se met pas a jour visuellement
                 
                 # On genere la grille puis on affiche
                 self.grille, self.taille_max = generer_grille(self.mes_points)
+                self.image_rgb = grille_en_rgb(self.grille, len(self.mes_points))
                 self.afficher()
                 
                 self.label.config(text=f"✓ {len(self.mes_points)} points chargés", fg="green")
@@ -145,9 +282,16 @@ class AppVoronoi:
         for widget in self.frame_canvas.winfo_children():
             widget.destroy()
         
+        # On ferme l'ancienne figure pour que pyplot ne les garde pas toutes en memoire
+        if self.fig is not None:
+            plt.close(self.fig)
+        
         # On cree la figure matplotlib avec la grille voronoi
+        # on la garde dans self.fig pour l'exporter ensuite sans tout redessiner
         fig, ax = plt.subplots(figsize=(8, 6), dpi=100)
-        ax.imshow(self.grille, origin="lower" ) 
+        self.fig = fig
+        # l'image est deja en couleurs (calculee une fois au chargement)
+        ax.imshow(self.image_rgb, origin="lower", interpolation="nearest")
         
         # On affiche les points par dessus en rouge pour qu on les voit bien
         for point in self.mes_points:
@@ -168,7 +312,7 @@ class AppVoronoi:
         # Boite de dialogue pour choisir ou sauvegarder
         fichier = filedialog.asksaveasfilename(defaultextension=".png", filetypes=[("PNG", "*.png")])
         if fichier:
-            exporter_diagramme(self.grille, self.mes_points, self.taille_max, fichier, 'png')
+            exporter_diagramme(self.fig, fichier, 'png')
             self.label.config(text="✓ PNG exporté", fg="green")
     
     def export_svg(self):
@@ -178,11 +322,18 @@ class AppVoronoi:
             return
         fichier = filedialog.asksaveasfilename(defaultextension=".svg", filetypes=[("SVG", "*.svg")])
         if fichier:
-            exporter_diagramme(self.grille, self.mes_points, self.taille_max, fichier ,'svg')
+            exporter_diagramme(self.fig, fichier, 'svg')
             self.label.config(text="✓ SVG exporté", fg="green")
     
     def run(self):
         self.fenetre.mainloop()
 
-app = AppVoronoi()
-app.run()
\ No newline at end of file
+def main():
+    # point d'entree de l'appli (importer le module ne lance rien)
+    app = AppVoronoi()
+    app.run()
+
+# on ne lance la fenetre que si on execute ce fichier directement
+# (sinon les processus de calcul en parallele relanceraient l'appli en important le module)
+if __name__ == "__main__":
+    main()
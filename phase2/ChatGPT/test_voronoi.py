@@ -1,11 +1,13 @@
 import os
 import numpy as np
 import pytest
+from matplotlib.collections import LineCollection
 
 from voronoi_app import (
     read_points,
     compute_perpendicular_bisector,
     generate_voronoi_edges,
+    plot_voronoi,
 )
 
 
@@ -27,6 +29,32 @@ def test_read_points_invalid_format(tmp_path):
         read_points(str(file))
 
 
+def test_read_points_blank_lines(tmp_path):
+    file = tmp_path / "points.txt"
+    file.write_text("0,0\n   \n1,1\n\n")
+
+    points = read_points(str(file))
+
+    assert points.shape == (2, 2)
+
+
+def test_read_points_windows_line_endings(tmp_path):
+    file = tmp_path / "points.txt"
+    file.write_bytes(b"0,0\r\n1.5,-2\r\n")
+
+    points = read_points(str(file))
+
+    assert np.allclose(points, [[0, 0], [1.5, -2]])
+
+
+def test_read_points_extra_column(tmp_path):
+    file = tmp_path / "points.txt"
+    file.write_text("0,0,0\n1\n")
+
+    with pytest.raises(ValueError, match="ligne 1"):
+        read_points(str(file))
+
+
 def test_read_points_less_than_two(tmp_path):
     file = tmp_path / "points.txt"
     file.write_text("0,0")
@@ -55,4 +83,44 @@ def test_generate_edges():
     edges = generate_voronoi_edges(points, (-10, 10, -10, 10))
 
     assert len(edges) == 1
-    assert len(edges[0][0]) == 500
\ No newline at end of file
+    assert len(edges[0][0]) == 500
+
+def test_generate_edges_vertical_bisector():
+    points = np.array([[0, 0], [2, 0]])
+    edges = generate_voronoi_edges(points, (-10, 10, -10, 10))
+
+    # La médiatrice de [(0,0), (2,0)] est la droite verticale x = 1
+    assert np.allclose(edges[0][0], 1)
+    assert np.allclose(edges[0][1], np.linspace(-10, 10, 500))
+
+
+def test_generate_edges_all_pairs():
+    points = np.array([[0, 0], [2, 0], [0, 2], [3, 3]])
+    edges = generate_voronoi_edges(points, (-10, 10, -10, 10))
+
+    assert len(edges) == 6
+    for x_vals, y_vals in edges:
+        assert len(x_vals) == len(y_vals) == 500
+
+
+def test_generate_edges_pair_order():
+    points = np.array([[0, 0], [2, 0], [0, 2], [3, 3]], dtype=float)
+    bounds = (-10, 10, -10, 10)
+    edges = generate_voronoi_edges(points, bounds)
+
+    # Chaque paire (i < j) donne la même médiatrice que son calcul isolé
+    for k, (i, j) in enumerate(zip(*np.triu_indices(len(points), 1))):
+        expected = generate_voronoi_edges(points[[i, j]], bounds)[0]
+        assert np.allclose(edges[k], expected)
+
+
+def test_plot_voronoi_single_collection():
+    points = np.array([[0, 0], [2, 0], [0, 2], [3, 3]])
+    fig = plot_voronoi(points)
+    ax = fig.axes[0]
+
+    # Une seule collection pour les 6 médiatrices, aucun Line2D individuel
+    lines = [c for c in ax.collections if isinstance(c, LineCollection)]
+    assert len(lines) == 1
+    assert len(lines[0].get_segments()) == 6
+    assert not ax.lines
@@ -10,17 +10,22 @@ Fonctionnalités :
 """
 
 import os
+import warnings
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
 
 # ==========================
 # LOGIQUE MÉTIER
 # ==========================
 
+# Nombre d'échantillons utilisés pour tracer chaque médiatrice
+N_SAMPLES = 500
+
 def read_points(file_path):
     """
     Lit un fichier texte contenant des points au format "x,y".
@@ -45,6 +50,86 @@ def read_points(file_path):
     if not os.path.exists(file_path):
         raise FileNotFoundError("Le fichier spécifié est introuvable.")
 
+    # Chemin rapide : analyse en C par numpy. En cas d'échec, la lecture
+    # ligne par ligne indique précisément la ligne fautive.
+    points = _read_points_fast(file_path)
+    if points is None:
+        points = _read_points_line_by_line(file_path)
+
+    if len(points) < 2:
+        raise ValueError("Au moins deux points sont requis.")
+
+    return points
+
+
+# Table de traduction : les virgules deviennent des séparateurs blancs
+_COMMA_TO_SPACE = bytes.maketrans(b",", b" ")
+
+
+def _read_points_fast(file_path):
+    """
+    Lecture rapide d'un fichier strictement au format "x,y" par ligne.
+
+    Le contenu est lu en bloc, les virgules sont remplacées par des espaces
+    et toutes les valeurs sont converties en un seul appel à numpy, sans
+    boucle Python sur les lignes.
+
+    Returns
+    -------
+    np.ndarray or None
+        Tableau float32 de shape (n, 2), ou None si le fichier ne respecte
+        pas exactement le format (espaces, lignes vides, colonnes en trop,
+        valeur non numérique) : la lecture ligne par ligne prend alors le
+        relais pour produire le message d'erreur adéquat.
+    """
+    with open(file_path, "rb") as file:
+        data = file.read().replace(b"\r", b"").strip()
+
+    if not data or b" " in data or b"\t" in data:
+        return None
+
+    # Chaque ligne doit contenir exactement une virgule : les séparateurs
+    # doivent alterner ',' puis '\n'
+    raw = np.frombuffer(data, dtype=np.uint8)
+    separators = raw[(raw == ord(",")) | (raw == ord("\n"))]
+    n_lines = (len(separators) + 1) // 2
+    if (
+        len(separators) != 2 * n_lines - 1
+        or np.any(separators[0::2] != ord(","))
+        or np.any(separators[1::2] != ord("\n"))
+    ):
+        return None
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            values = np.fromstring(
+                data.translate(_COMMA_TO_SPACE), dtype=np.float32, sep=" "
+            )
+    except (ValueError, DeprecationWarning):
+        return None
+
+    if values.size != 2 * n_lines:
+        return None
+
+    return values.reshape(-1, 2)
+
+
+def _read_points_line_by_line(file_path):
+    """
+    Lecture ligne par ligne utilisée lorsque numpy ne peut pas analyser
+    le fichier (lignes vides contenant des espaces, ligne mal formée).
+
+    Returns
+    -------
+    np.ndarray
+        Tableau float32 de shape (n, 2).
+
+    Raises
+    ------
+    ValueError
+        Si une ligne ne respecte pas le format "x,y".
+    """
     points = []
 
     with open(file_path, "r", encoding="utf-8") as file:
@@ -69,29 +154,29 @@ def read_points(file_path):
 
             points.append((x, y))
 
-    if len(points) < 2:
-        raise ValueError("Au moins deux points sont requis.")
-
-    return np.array(points)
+    return np.array(points, dtype=np.float32).reshape(-1, 2)
 
 
 def compute_perpendicular_bisector(p1, p2):
     """
     Calcule la médiatrice du segment [p1, p2].
 
+    Accepte aussi des tableaux de points de shape (m, 2) : les
+    coefficients sont alors calculés pour les m segments à la fois.
+
     Returns
     -------
     tuple
         (a, b, c) coefficients de la droite ax + by + c = 0
     """
     midpoint = (p1 + p2) / 2
-    dx = p2[0] - p1[0]
-    dy = p2[1] - p1[1]
+    dx = p2[..., 0] - p1[..., 0]
+    dy = p2[..., 1] - p1[..., 1]
 
     # Droite perpendiculaire
     a = dx
     b = dy
-    c = -(a * midpoint[0] + b * midpoint[1])
+    c = -(a * midpoint[..., 0] + b * midpoint[..., 1])
 
     return a, b, c
 
@@ -100,6 +185,11 @@ def generate_voronoi_edges(points, bounds):
     """
     Génère les médiatrices pour chaque paire de points.
 
+    Toutes les paires (i < j) sont traitées en une seule opération
+    vectorisée. La médiatrice de (j, i) étant celle de (i, j), seule la
+    moitié supérieure des paires est calculée, dans l'ordre de
+    ``np.triu_indices``.
+
     Parameters
     ----------
     points : np.ndarray
@@ -108,26 +198,32 @@ def generate_voronoi_edges(points, bounds):
 
     Returns
     -------
-    list
-        Liste de segments (x_vals, y_vals)
+    np.ndarray
+        Tableau de shape (n_paires, 2, N_SAMPLES) : pour chaque paire,
+        la ligne 0 contient x_vals et la ligne 1 contient y_vals.
     """
     xmin, xmax, ymin, ymax = bounds
-    edges = []
-
-    for i in range(len(points)):
-        for j in range(i + 1, len(points)):
-            a, b, c = compute_perpendicular_bisector(
-                points[i], points[j]
-            )
-
-            if abs(b) > 1e-10:
-                x_vals = np.linspace(xmin, xmax, 500)
-                y_vals = (-a * x_vals - c) / b
-            else:
-                x_vals = np.full(500, -c / a)
-                y_vals = np.linspace(ymin, ymax, 500)
-
-            edges.append((x_vals, y_vals))
+    points = np.asarray(points, dtype=float)
+
+    i, j = np.triu_indices(len(points), 1)
+    a, b, c = compute_perpendicular_bisector(points[i], points[j])
+
+    # Abscisses et ordonnées d'échantillonnage communes à toutes les paires
+    x_vals = np.linspace(xmin, xmax, N_SAMPLES)
+    y_vals = np.linspace(ymin, ymax, N_SAMPLES)
+
+    # Médiatrices verticales (b ~ 0) : x constant, y parcourt les bornes
+    vertical = np.abs(b) <= 1e-10
+    safe_a = np.where(vertical, a, 1.0)[:, None]
+    safe_b = np.where(vertical, 1.0, b)[:, None]
+
+    edges = np.empty((len(a), 2, N_SAMPLES))
+    edges[:, 0] = np.where(vertical[:, None], -c[:, None] / safe_a, x_vals)
+    edges[:, 1] = np.where(
+        vertical[:, None],
+        y_vals,
+        (-a[:, None] * x_vals - c[:, None]) / safe_b,
+    )
 
     return edges
 
@@ -155,8 +251,12 @@ def plot_voronoi(points, save_path=None):
         points, (xmin, xmax, ymin, ymax)
     )
 
-    for x_vals, y_vals in edges:
-        ax.plot(x_vals, y_vals)
+    # Les médiatrices sont des droites : leurs deux extrémités suffisent.
+    # Un seul artiste pour toutes les paires au lieu d'un Line2D par paire,
+    # avec les mêmes couleurs que le cycle par défaut de ax.plot.
+    segments = edges[:, :, [0, -1]].transpose(0, 2, 1)
+    colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+    ax.add_collection(LineCollection(segments, colors=colors))
 
     ax.scatter(points[:, 0], points[:, 1], zorder=5)
 
@@ -4,9 +4,10 @@ Exécuter avec la commande : pytest test_voronoi.py -v
 """
 
 import os
+import warnings
 import numpy as np
 import pytest
-from voronoi_app import read_points_file, generate_voronoi_grid
+from voronoi_app import read_points_file, generate_voronoi_grid, generate_voronoi_polygons
 
 # ==========================================
 # FIXTURES (Données de test)
@@ -73,6 +74,13 @@ class TestReadPointsFile:
         points = read_points_file(str(file))
         assert points.shape == (2, 2)
 
+    def test_trois_colonnes(self, tmp_path):
+        """Vérifie qu'un fichier à trois colonnes est refusé avec le numéro de ligne."""
+        file = tmp_path / "trois_colonnes.txt"
+        file.write_text("1,2,3\n4,5,6\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="Format incorrect à la ligne 1"):
+            read_points_file(str(file))
+
 
 # ==========================================
 # TESTS : generate_voronoi_grid
@@ -110,3 +118,102 @@ class TestGenerateVoronoiGrid:
         
         # Vérifie qu'aucune erreur LinAlg n'est levée et que 3 zones distinctes sont créées
         assert len(np.unique(Z)) == 3
+
+    def test_equivalence_force_brute(self):
+        """Vérifie que chaque pixel est attribué au point réellement le plus proche."""
+        rng = np.random.default_rng(0)
+        points = rng.uniform(0, 100, size=(25, 2))
+        X, Y, Z = generate_voronoi_grid(points, resolution=40)
+
+        dist_sq = (X[..., None] - points[:, 0])**2 + (Y[..., None] - points[:, 1])**2
+        assert np.array_equal(Z, dist_sq.argmin(axis=-1))
+
+    def test_repli_numpy_par_tuiles(self, monkeypatch):
+        """Vérifie le repli Numpy (sans Numba ni SciPy) sur une grille découpée en plusieurs tuiles."""
+        import voronoi_app
+        monkeypatch.setattr(voronoi_app, "NUMBA_DISPONIBLE", False)
+        monkeypatch.setattr(voronoi_app, "SCIPY_DISPONIBLE", False)
+        rng = np.random.default_rng(4)
+        points = rng.uniform(0, 100, size=(300, 2))
+        resolution = 60
+        # 300 points : tuiles d'environ 14 pixels de côté, donc plusieurs tuiles par axe
+        assert np.sqrt(voronoi_app.TAILLE_CACHE_TUILE / (4 * len(points))) < resolution / 2
+        X, Y, Z = generate_voronoi_grid(points, resolution=resolution)
+
+        pts = points.astype(np.float32)
+        dist_sq = (X[..., None] - pts[:, 0])**2 + (Y[..., None] - pts[:, 1])**2
+        assert np.array_equal(Z, dist_sq.argmin(axis=-1))
+
+    def test_backend_jfa(self):
+        """Vérifie que le Jump Flooding retrouve la même partition sur un cas simple."""
+        rng = np.random.default_rng(1)
+        points = rng.uniform(0, 100, size=(10, 2))
+        X, Y, Z = generate_voronoi_grid(points, resolution=64)
+        _, _, Z_jfa = generate_voronoi_grid(points, resolution=64, backend='jfa')
+
+        assert Z_jfa.shape == Z.shape
+        assert np.mean(Z_jfa == Z) > 0.99
+
+    def test_backend_jfa_un_pixel(self):
+        """Vérifie que le Jump Flooding accepte une grille d'un seul pixel."""
+        points = np.array([[0.0, 0.0], [10.0, 10.0]])
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            _, _, Z = generate_voronoi_grid(points, resolution=1, backend='jfa')
+        assert Z.shape == (1, 1)
+        assert Z[0, 0] in (0, 1)
+
+    def test_backend_inconnu(self):
+        """Vérifie l'erreur levée pour un backend non supporté."""
+        with pytest.raises(ValueError, match="Backend inconnu"):
+            generate_voronoi_grid(np.array([[0, 0], [1, 1]]), backend='opengl')
+
+    def test_type_indices_compact(self):
+        """Vérifie que la carte des zones est stockée sur des entiers 16 bits."""
+        points = np.array([[0, 0], [10, 10]])
+        X, Y, Z = generate_voronoi_grid(points, resolution=20)
+        assert Z.dtype == np.int16
+
+    def test_backend_kdtree(self):
+        """Vérifie que l'arbre k-d donne la même partition que le calcul direct."""
+        pytest.importorskip("scipy")
+        rng = np.random.default_rng(2)
+        points = rng.uniform(0, 100, size=(30, 2))
+        X, Y, Z = generate_voronoi_grid(points, resolution=50)
+        _, _, Z_kd = generate_voronoi_grid(points, resolution=50, backend='kdtree')
+        assert np.array_equal(Z_kd, Z)
+
+    def test_backend_gpu(self):
+        """Vérifie le backend 'gpu' (repli sur le calcul CPU si CuPy est absent)."""
+        points = np.array([[0, 0], [10, 10], [0, 10]])
+        X, Y, Z = generate_voronoi_grid(points, resolution=30)
+        _, _, Z_gpu = generate_voronoi_grid(points, resolution=30, backend='gpu')
+        assert np.array_equal(Z_gpu, Z)
+
+
+class TestGenerateVoronoiPolygons:
+
+    def test_partition_de_la_boite(self):
+        """Vérifie que les cellules pavent la boîte et contiennent chacune leur germe."""
+        pytest.importorskip("scipy")
+        from matplotlib.path import Path
+        rng = np.random.default_rng(3)
+        points = rng.uniform(0, 100, size=(20, 2))
+        polygons, (x_start, x_end, y_start, y_end) = generate_voronoi_polygons(points)
+
+        assert len(polygons) == len(points)
+        aire = sum(0.5 * abs(np.dot(p[:, 0], np.roll(p[:, 1], 1)) - np.dot(p[:, 1], np.roll(p[:, 0], 1)))
+                   for p in polygons)
+        assert aire == pytest.approx((x_end - x_start) * (y_end - y_start))
+        for poly, site in zip(polygons, points):
+            assert Path(poly).contains_point(site)
+
+    def test_sites_confondus(self):
+        """Vérifie qu'une cellule partagée par des points confondus n'est produite qu'une fois."""
+        pytest.importorskip("scipy")
+        points = np.array([[10.0, 10.0], [40.0, 30.0], [10.0, 10.0]])
+        polygons, _ = generate_voronoi_polygons(points)
+
+        assert len(polygons) == 3
+        assert len(polygons[0]) > 2
+        assert len(polygons[2]) == 0
@@ -9,17 +9,48 @@ Fonctionnalités :
 """
 
 import os
+import warnings
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import PolyCollection
+
+# Numba est optionnel : sans lui, la génération reste en Numpy pur.
+try:
+    from numba import njit, prange
+    NUMBA_DISPONIBLE = True
+except ImportError:
+    NUMBA_DISPONIBLE = False
+
+# SciPy est optionnel : son arbre k-d accélère la recherche lorsque les points sont nombreux.
+try:
+    from scipy.spatial import cKDTree, Voronoi
+    SCIPY_DISPONIBLE = True
+except ImportError:
+    SCIPY_DISPONIBLE = False
+
+# CuPy (GPU) est optionnel et n'est utilisé que par les backends 'gpu' et 'jfa',
+# à condition qu'un GPU soit réellement utilisable (sinon repli sur Numpy).
+try:
+    import cupy as cp
+    CUPY_DISPONIBLE = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:  # cupy absent, ou pilote CUDA / GPU introuvable
+    CUPY_DISPONIBLE = False
 
 
 # ==========================================
 # LOGIQUE MÉTIER (Traitement et Algorithme)
 # ==========================================
 
+# Taille visée (en octets) du cube de distances d'une tuile dans le repli Numpy
+# de generate_voronoi_grid : de l'ordre d'un cache L2.
+TAILLE_CACHE_TUILE = 256 * 1024
+
+# Au-delà de ce nombre de points, le backend 'auto' utilise un arbre k-d (si SciPy est installé).
+SEUIL_KDTREE = 200
+
 def read_points_file(filepath: str) -> np.ndarray:
     """
     Lit un fichier texte et extrait les coordonnées des points.
@@ -39,6 +70,38 @@ def read_points_file(filepath: str) -> np.ndarray:
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"Le fichier spécifié est introuvable : {filepath}")
 
+    # Chemin rapide : analyse du fichier entièrement en C par Numpy.
+    # Si le fichier n'est pas "propre", la lecture ligne par ligne prend le relais
+    # et produit un message d'erreur indiquant la ligne fautive.
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # Avertissement Numpy sur fichier vide
+            points = np.loadtxt(filepath, delimiter=',', dtype=np.float32,
+                                comments=None, ndmin=2, encoding='utf-8')
+        if points.shape[1] != 2:
+            points = _read_points_line_by_line(filepath)
+    except ValueError:
+        points = _read_points_line_by_line(filepath)
+
+    if len(points) < 2:
+        raise ValueError("Le fichier doit contenir au moins 2 points pour générer un diagramme.")
+
+    return points
+
+
+def _read_points_line_by_line(filepath: str) -> np.ndarray:
+    """
+    Lecture ligne par ligne, utilisée quand Numpy ne peut pas analyser le fichier.
+
+    Args:
+        filepath (str): Le chemin vers le fichier texte.
+
+    Returns:
+        np.ndarray: Un tableau float32 de forme (N, 2).
+
+    Raises:
+        ValueError: Si une ligne ne respecte pas le format x,y.
+    """
     points = []
     with open(filepath, 'r', encoding='utf-8') as f:
         for line_idx, line in enumerate(f, start=1):
@@ -57,13 +120,200 @@ def read_points_file(filepath: str) -> np.ndarray:
             except ValueError:
                 raise ValueError(f"Valeurs non numériques à la ligne {line_idx}.")
 
-    if len(points) < 2:
-        raise ValueError("Le fichier doit contenir au moins 2 points pour générer un diagramme.")
+    return np.array(points, dtype=np.float32).reshape(-1, 2)
+
+
+if NUMBA_DISPONIBLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _voronoi_kernel(pts_x: np.ndarray, pts_y: np.ndarray,
+                        x: np.ndarray, y: np.ndarray, Z: np.ndarray) -> None:
+        """
+        Noyau compilé : pour chaque pixel, conserve le couple (distance minimale, indice)
+        en parcourant les points, sans tableau temporaire (N, H, W).
+
+        Les lignes de la grille sont réparties sur les cœurs via `prange`. Pour chaque
+        ligne, les points sont balayés un par un en mettant à jour toute la ligne :
+        la boucle interne sur des pixels contigus est vectorisable (SIMD).
+        Le résultat est écrit dans `Z`, préalloué avec le type entier voulu.
+        """
+        width = x.shape[0]
+        for row in prange(y.shape[0]):
+            best = np.empty(width, dtype=x.dtype)
+            dy = y[row] - pts_y[0]
+            dy2 = dy * dy
+            for col in range(width):
+                dx = x[col] - pts_x[0]
+                best[col] = dx * dx + dy2
+                Z[row, col] = 0
+            for k in range(1, pts_x.shape[0]):
+                dy = y[row] - pts_y[k]
+                dy2 = dy * dy
+                for col in range(width):
+                    dx = x[col] - pts_x[k]
+                    d = dx * dx + dy2
+                    if d < best[col]:
+                        best[col] = d
+                        Z[row, col] = k
+
+
+def _index_dtype(n_points: int) -> type:
+    """Plus petit type entier signé capable de stocker les indices de `n_points` points."""
+    return np.int16 if n_points <= np.iinfo(np.int16).max else np.int32
+
+
+def _grid_numpy(points: np.ndarray, x: np.ndarray, y: np.ndarray, Z: np.ndarray) -> None:
+    """
+    Calcule la carte des zones `Z` en Numpy pur (repli lorsque Numba est absent).
+
+    L'image est traitée par tuiles carrées dont le cube de distances (N, T, T)
+    tient dans le cache L2 : chaque tuile est calculée en une expression diffusée
+    puis réduite par argmin, sans aller-retour en mémoire centrale.
+    """
+    pts = np.asarray(points, dtype=np.float32)
+    px = pts[:, 0, None, None]
+    py = pts[:, 1, None, None]
+
+    # Côté de tuile tel que N * T * T * 4 octets (float32) ≈ TAILLE_CACHE_TUILE
+    tile = max(8, int(np.sqrt(TAILLE_CACHE_TUILE / (4 * len(pts)))))
+
+    for ty in range(0, len(y), tile):
+        ys = y[None, ty:ty + tile, None]
+        dy2 = (py - ys)**2
+        for tx in range(0, len(x), tile):
+            xs = x[None, None, tx:tx + tile]
+            dist_sq = (px - xs)**2 + dy2
+            Z[ty:ty + tile, tx:tx + tile] = dist_sq.argmin(axis=0)
+
+
+def _grid_kdtree(points: np.ndarray, X: np.ndarray, Y: np.ndarray, Z: np.ndarray) -> None:
+    """
+    Calcule la carte des zones `Z` par requêtes dans un arbre k-d : O(H·W·log N)
+    au lieu de O(H·W·N), sans cube de distances. La requête est multithreadée.
+    """
+    tree = cKDTree(points)
+    _, idx = tree.query(np.column_stack((X.ravel(), Y.ravel())), k=1, workers=-1)
+    Z[...] = idx.reshape(Z.shape)
+
+
+if CUPY_DISPONIBLE:
+    # Mise à jour en place, pour un point, de la distance minimale et de l'indice de chaque pixel
+    _gpu_update = cp.ElementwiseKernel(
+        'float64 gx, float64 gy, float64 px, float64 py, int32 i',
+        'float64 min_d2, int32 z',
+        '''
+        double dx = gx - px;
+        double dy = gy - py;
+        double d = dx * dx + dy * dy;
+        if (d < min_d2) {
+            min_d2 = d;
+            z = i;
+        }
+        ''',
+        'voronoi_update')
+
+
+def _grid_gpu(points: np.ndarray, x: np.ndarray, y: np.ndarray, Z: np.ndarray) -> None:
+    """
+    Calcule la carte des zones `Z` sur GPU avec CuPy.
+
+    Un noyau élémentaire est lancé par point et met à jour en place le couple
+    (distance minimale, indice) de chaque pixel : aucun tenseur (N, H, W) n'est alloué.
+    """
+    gx = cp.asarray(x)[None, :]
+    gy = cp.asarray(y)[:, None]
+    min_d2 = cp.full(Z.shape, cp.inf, dtype=cp.float64)
+    z = cp.zeros(Z.shape, dtype=cp.int32)
+
+    for i, (px, py) in enumerate(np.asarray(points, dtype=np.float64)):
+        _gpu_update(gx, gy, px, py, np.int32(i), min_d2, z)
+
+    Z[...] = cp.asnumpy(z)
+
+
+def _shift(xp, a, dy: int, dx: int, fill):
+    """Retourne `out` tel que out[i, j] = a[i + dy, j + dx], complété par `fill` hors de la grille."""
+    h, w = a.shape
+    out = xp.full_like(a, fill)
+    out[max(0, -dy):h - max(0, dy), max(0, -dx):w - max(0, dx)] = \
+        a[max(0, dy):h + min(0, dy), max(0, dx):w + min(0, dx)]
+    return out
+
+
+def _jump_flood(xp, points: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Approxime la carte des zones par l'algorithme de Jump Flooding (JFA).
+
+    Chaque point est d'abord déposé sur le pixel le plus proche, puis chaque passe
+    (pas k = R/2, R/4, ..., 1) propage les étiquettes en testant 8 voisins à ±k.
+    Le coût est O(H·W·log(max(H, W))), indépendant du nombre de points.
+    Une passe supplémentaire de pas 1 (variante « JFA+1 ») corrige la plupart des erreurs.
+
+    Le module `xp` (numpy ou cupy) choisit l'exécution sur CPU ou sur GPU.
+
+    Returns:
+        np.ndarray: Matrice (H, W) des indices du point le plus proche.
+    """
+    h, w = len(y), len(x)
+    pts = xp.asarray(points, dtype=xp.float64)
+    gx = xp.asarray(x)[None, :]
+    gy = xp.asarray(y)[:, None]
+
+    # L'étiquette -1 (pixel non encore atteint) désigne un site sentinelle à l'infini
+    sites_x = xp.concatenate((pts[:, 0], xp.asarray([xp.inf])))
+    sites_y = xp.concatenate((pts[:, 1], xp.asarray([xp.inf])))
+
+    # Taille d'un pixel ; une grille d'un seul pixel n'a pas d'étendue (division par zéro)
+    px_w = (x[-1] - x[0]) / max(w - 1, 1) or 1.0
+    px_h = (y[-1] - y[0]) / max(h - 1, 1) or 1.0
+    cols = xp.rint((pts[:, 0] - x[0]) / px_w).astype(xp.int64)
+    rows = xp.rint((pts[:, 1] - y[0]) / px_h).astype(xp.int64)
+    labels = xp.full((h, w), -1, dtype=xp.int32)
+    labels[xp.clip(rows, 0, h - 1), xp.clip(cols, 0, w - 1)] = xp.arange(len(points), dtype=xp.int32)
+
+    def dist_sq(lbl):
+        return (gx - sites_x[lbl])**2 + (gy - sites_y[lbl])**2
+
+    # Pas successifs : plus grande puissance de 2 inférieure à la taille, puis moitiés
+    steps = []
+    step = 1 << ((max(h, w) - 1).bit_length() - 1) if max(h, w) > 1 else 1
+    while step >= 1:
+        steps.append(step)
+        step //= 2
+    steps.append(1)
+
+    for step in steps:
+        best = labels
+        best_d = dist_sq(labels)
+        for dy in (-step, 0, step):
+            for dx in (-step, 0, step):
+                if dy == 0 and dx == 0:
+                    continue
+                candidate = _shift(xp, labels, dy, dx, -1)
+                d = dist_sq(candidate)
+                mieux = d < best_d
+                best = xp.where(mieux, candidate, best)
+                best_d = xp.where(mieux, d, best_d)
+        labels = best
+
+    if xp is not np:
+        labels = xp.asnumpy(labels)
+    return labels
+
+
+def _bounding_box(points: np.ndarray, padding: float) -> tuple:
+    """Retourne (x_start, x_end, y_start, y_end) : la boîte englobante des points, élargie de `padding`."""
+    min_x, max_x = np.min(points[:, 0]), np.max(points[:, 0])
+    min_y, max_y = np.min(points[:, 1]), np.max(points[:, 1])
+
+    range_x = max_x - min_x if max_x > min_x else 1.0
+    range_y = max_y - min_y if max_y > min_y else 1.0
 
-    return np.array(points)
+    return (min_x - padding * range_x, max_x + padding * range_x,
+            min_y - padding * range_y, max_y + padding * range_y)
 
 
-def generate_voronoi_grid(points: np.ndarray, resolution: int = 800, padding: float = 0.1) -> tuple:
+def generate_voronoi_grid(points: np.ndarray, resolution: int = 800, padding: float = 0.1,
+                          backend: str = 'auto') -> tuple:
     """
     Génère une grille discrète représentant le diagramme de Voronoï.
     
@@ -74,45 +324,113 @@ def generate_voronoi_grid(points: np.ndarray, resolution: int = 800, padding: fl
         points (np.ndarray): Tableau des coordonnées des points (N, 2).
         resolution (int): Nombre de pixels pour la largeur et la hauteur.
         padding (float): Marge autour des points extrêmes.
+        backend (str): 'auto' (calcul exact : arbre k-d au-delà de SEUIL_KDTREE points,
+                       sinon noyau Numba si disponible, sinon Numpy), 'kdtree' (arbre k-d
+                       SciPy), 'gpu' (calcul exact avec CuPy, 'auto' si CuPy est absent)
+                       ou 'jfa' (Jump Flooding approché, sur GPU si CuPy est disponible).
 
     Returns:
         tuple: (X, Y, Z) où X et Y sont les grilles de coordonnées (meshgrid), 
                et Z est la matrice des indices du point le plus proche.
+
+    Raises:
+        ValueError: Si le backend demandé est inconnu.
     """
+    if backend not in ('auto', 'kdtree', 'gpu', 'jfa'):
+        raise ValueError(f"Backend inconnu : {backend!r}. Attendu : 'auto', 'kdtree', 'gpu' ou 'jfa'.")
+    if backend == 'kdtree' and not SCIPY_DISPONIBLE:
+        raise ValueError("Le backend 'kdtree' nécessite SciPy.")
+
     # Calcul de la boîte englobante (bounding box)
-    min_x, max_x = np.min(points[:, 0]), np.max(points[:, 0])
-    min_y, max_y = np.min(points[:, 1]), np.max(points[:, 1])
+    x_start, x_end, y_start, y_end = _bounding_box(points, padding)
 
-    range_x = max_x - min_x if max_x > min_x else 1.0
-    range_y = max_y - min_y if max_y > min_y else 1.0
+    # Création de la grille (Meshgrid). float32 suffit pour des coordonnées de
+    # pixels : deux fois moins de mémoire parcourue et deux fois plus de
+    # distances par instruction SIMD qu'en float64
+    x = np.linspace(x_start, x_end, resolution, dtype=np.float32)
+    y = np.linspace(y_start, y_end, resolution, dtype=np.float32)
+    X, Y = np.meshgrid(x, y)
 
-    x_start, x_end = min_x - padding * range_x, max_x + padding * range_x
-    y_start, y_end = min_y - padding * range_y, max_y + padding * range_y
+    # Z ne contient que des indices de points : un entier 16 bits suffit le plus souvent
+    Z = np.empty((resolution, resolution), dtype=_index_dtype(len(points)))
+
+    if backend == 'gpu' and not CUPY_DISPONIBLE:
+        backend = 'auto'
+    if backend == 'auto' and SCIPY_DISPONIBLE and len(points) > SEUIL_KDTREE:
+        backend = 'kdtree'
+
+    if backend == 'jfa':
+        Z[...] = _jump_flood(cp if CUPY_DISPONIBLE else np, points, x, y)
+    elif backend == 'gpu':
+        _grid_gpu(points, x, y, Z)
+    elif backend == 'kdtree':
+        _grid_kdtree(points, X, Y, Z)
+    elif NUMBA_DISPONIBLE:
+        pts = np.asarray(points, dtype=np.float32)
+        _voronoi_kernel(pts[:, 0].copy(), pts[:, 1].copy(), x, y, Z)
+    else:
+        _grid_numpy(points, x, y, Z)
 
-    # Création de la grille (Meshgrid)
-    x = np.linspace(x_start, x_end, resolution)
-    y = np.linspace(y_start, y_end, resolution)
-    X, Y = np.meshgrid(x, y)
+    return X, Y, Z
 
-    # Initialisation de la carte des zones (Z) et des distances minimales
-    Z = np.zeros((resolution, resolution), dtype=int)
-    min_dists = np.full((resolution, resolution), np.inf)
 
-    # Opération vectorisée pour trouver le point le plus proche de chaque pixel
-    for i, point in enumerate(points):
-        # Distance euclidienne au carré (plus rapide car sans racine carrée)
-        dist_sq = (X - point[0])**2 + (Y - point[1])**2
-        mask = dist_sq < min_dists
-        min_dists[mask] = dist_sq[mask]
-        Z[mask] = i
+def generate_voronoi_polygons(points: np.ndarray, padding: float = 0.1) -> tuple:
+    """
+    Calcule les cellules de Voronoï exactes, découpées sur la boîte englobante.
 
-    return X, Y, Z
+    Utilise scipy.spatial.Voronoi (Qhull, O(N log N)) au lieu d'une grille de pixels.
+    Les points sont reflétés de l'autre côté de chaque bord de la boîte : les cellules
+    des points d'origine deviennent alors bornées et coïncident exactement avec leur
+    découpe par la boîte.
+
+    Args:
+        points (np.ndarray): Tableau des coordonnées des points (N, 2).
+        padding (float): Marge autour des points extrêmes.
+
+    Returns:
+        tuple: (polygons, bounds) où polygons est la liste des N polygones (sommets (M, 2))
+               dans l'ordre des points, et bounds = (x_start, x_end, y_start, y_end).
+               Des points confondus partagent une même cellule : seule la première
+               occurrence la reçoit, les suivantes ont un polygone vide.
+
+    Raises:
+        ValueError: Si SciPy n'est pas installé.
+    """
+    if not SCIPY_DISPONIBLE:
+        raise ValueError("Le rendu par polygones nécessite SciPy.")
+
+    pts = np.asarray(points, dtype=np.float64)
+    bounds = _bounding_box(pts, padding)
+    x_start, x_end, y_start, y_end = bounds
+
+    mirrored = [pts]
+    for axis, edge in ((0, x_start), (0, x_end), (1, y_start), (1, y_end)):
+        reflected = pts.copy()
+        reflected[:, axis] = 2 * edge - reflected[:, axis]
+        mirrored.append(reflected)
+
+    vor = Voronoi(np.concatenate(mirrored))
+    # Une cellule par site distinct, sinon la collection la dessinerait plusieurs
+    # fois, dans des couleurs différentes
+    cells = vor.point_region[:len(pts)]
+    _, first = np.unique(cells, return_index=True)
+    polygons = [np.empty((0, 2))] * len(pts)
+    for i in first:
+        polygons[i] = vor.vertices[vor.regions[cells[i]]]
+    return polygons, bounds
 
 
 # ==========================================
 # INTERFACE UTILISATEUR (Tkinter + Matplotlib)
 # ==========================================
 
+# Résolution par défaut des exports PNG (le SVG, vectoriel, n'en a pas besoin)
+EXPORT_DPI = 150
+
+# Au-delà de ce nombre de points, les coordonnées ne sont plus annotées :
+# un artiste Text par point rendrait chaque affichage très lent (et illisible).
+MAX_ANNOTATIONS = 50
+
 class VoronoiApp:
     """Interface graphique principale pour l'application Voronoï."""
 
@@ -124,6 +442,13 @@ class VoronoiApp:
         
         self.points = None
         self.fig, self.ax = plt.subplots(figsize=(6, 6))
+        # 'pixel' : grille rastérisée ; 'analytic' : polygones exacts (nécessite SciPy)
+        self.render_mode = tk.StringVar(value='pixel')
+        # Artistes persistants, créés au premier affichage (voir _create_artists)
+        self._image = None
+        self._cells = None
+        self._scatter = None
+        self._labels = []
         
         self._build_ui()
 
@@ -144,6 +469,16 @@ class VoronoiApp:
                                    fg="#aaaaaa", bg="#2b2b2b", wraplength=200)
         self.file_label.pack(pady=5)
 
+        # Mode de rendu
+        tk.Label(control_panel, text="Rendu", font=("Arial", 11, "bold"), 
+                 fg="white", bg="#2b2b2b").pack(pady=(15, 5))
+        for text, mode in (("Pixels", 'pixel'), ("Polygones exacts", 'analytic')):
+            tk.Radiobutton(control_panel, text=text, value=mode, variable=self.render_mode,
+                           command=self._on_render_mode_change,
+                           state=tk.NORMAL if mode == 'pixel' or SCIPY_DISPONIBLE else tk.DISABLED,
+                           fg="white", bg="#2b2b2b", selectcolor="#2b2b2b",
+                           activebackground="#2b2b2b").pack(anchor=tk.W)
+
         tk.Label(control_panel, text="─" * 25, fg="#555555", bg="#2b2b2b").pack(pady=15)
 
         # Boutons d'exportation
@@ -194,40 +529,90 @@ class VoronoiApp:
             messagebox.showerror("Erreur", str(e))
             self.file_label.config(text="Erreur de chargement", fg="#e74c3c")
 
+    def _on_render_mode_change(self):
+        """Redessine le diagramme lorsque le mode de rendu change."""
+        if self.points is not None:
+            self.plot_voronoi()
+
+    def _create_artists(self):
+        """
+        Crée une fois pour toutes les artistes du diagramme (image, polygones, points).
+
+        Les affichages suivants ne font que mettre à jour leurs données,
+        au lieu de vider les axes et de tout reconstruire.
+        """
+        self.ax.clear()
+        self._image = self.ax.imshow(np.zeros((1, 1), dtype=np.int16), origin='lower', cmap='tab20',
+                                     alpha=0.6, interpolation='nearest', visible=False)
+        self._cells = PolyCollection([], cmap='tab20', alpha=0.6, edgecolors='none', visible=False)
+        self.ax.add_collection(self._cells)
+        self._scatter = self.ax.scatter([], [], c='k', s=16, label='Points germes')
+        self._labels = []
+
+        self.ax.set_title("Diagramme de Voronoï")
+        self.ax.set_xlabel("X")
+        self.ax.set_ylabel("Y")
+        self.ax.set_aspect('equal')
+
     def plot_voronoi(self):
         """Affiche le diagramme sur le canevas Matplotlib."""
-        self.ax.clear()
-        
-        # Génération
-        X, Y, Z = generate_voronoi_grid(self.points)
+        if self._scatter is None:
+            self._create_artists()
         
-        # Affichage de la carte des couleurs
-        self.ax.imshow(
-            Z, 
-            extent=(X.min(), X.max(), Y.min(), Y.max()), 
-            origin='lower',
-            cmap='tab20', 
-            alpha=0.6, 
-            aspect='equal'
-        )
+        if self.render_mode.get() == 'analytic':
+            bounds = self._draw_polygons()
+        else:
+            bounds = self._draw_pixels()
+        self.ax.set_xlim(bounds[0], bounds[1])
+        self.ax.set_ylim(bounds[2], bounds[3])
         
-        # Affichage des points par-dessus
-        self.ax.plot(self.points[:, 0], self.points[:, 1], 'ko', markersize=4, label='Points germes')
+        # Points par-dessus (une seule collection pour tous les points)
+        self._scatter.set_offsets(self.points)
         
-        # Annotations des coordonnées
-        for (px, py) in self.points:
-            self.ax.annotate(f"({px}, {py})", (px, py), xytext=(4, 4), 
-                             textcoords='offset points', fontsize=8)
+        # Annotations des coordonnées, seulement quand les points sont peu nombreux
+        for label in self._labels:
+            label.remove()
+        self._labels = []
+        if len(self.points) <= MAX_ANNOTATIONS:
+            self._labels = [self.ax.annotate(f"({px}, {py})", (px, py), xytext=(4, 4), 
+                                             textcoords='offset points', fontsize=8)
+                            for (px, py) in self.points]
 
-        self.ax.set_title("Diagramme de Voronoï")
-        self.ax.set_xlabel("X")
-        self.ax.set_ylabel("Y")
-        self.ax.axis('on')
         self.fig.tight_layout()
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
-    def export_image(self, fmt: str):
-        """Exporte le graphique au format demandé (png ou svg)."""
+    def _draw_pixels(self) -> tuple:
+        """Met à jour la grille rastérisée des zones (imshow) et retourne son emprise."""
+        X, Y, Z = generate_voronoi_grid(self.points)
+        extent = (X.min(), X.max(), Y.min(), Y.max())
+        
+        self._image.set_data(Z)
+        self._image.set_extent(extent)
+        self._image.set_clim(0, len(self.points) - 1)
+        self._image.set_visible(True)
+        self._cells.set_visible(False)
+        return extent
+
+    def _draw_polygons(self) -> tuple:
+        """Met à jour les cellules exactes (une seule collection de polygones) et retourne leur emprise."""
+        polygons, bounds = generate_voronoi_polygons(self.points)
+        
+        self._cells.set_verts(polygons)
+        self._cells.set_array(np.arange(len(polygons)))
+        self._cells.set_clim(0, len(polygons) - 1)
+        self._cells.set_visible(True)
+        self._image.set_visible(False)
+        return bounds
+
+    def export_image(self, fmt: str, dpi: int = EXPORT_DPI):
+        """
+        Exporte le graphique au format demandé (png ou svg).
+
+        Le SVG est vectoriel : ni résolution ni recadrage à calculer. Le PNG est
+        rendu à `dpi` points par pouce, sans recadrage 'tight' (la mise en page
+        est déjà ajustée par tight_layout à chaque affichage), ce qui évite une
+        seconde passe de rendu.
+        """
         if self.points is None:
             return
             
@@ -238,7 +623,10 @@ class VoronoiApp:
         
         if filepath:
             try:
-                self.fig.savefig(filepath, format=fmt, dpi=300, bbox_inches='tight')
+                if fmt == 'svg':
+                    self.fig.savefig(filepath, format='svg')
+                else:
+                    self.fig.savefig(filepath, format=fmt, dpi=dpi)
                 messagebox.showinfo("Succès", f"Fichier exporté avec succès :\n{filepath}")
             except Exception as e:
                 messagebox.showerror("Erreur d'exportation", f"Impossible de sauvegarder : {str(e)}")
@@ -1,9 +1,219 @@
 import os
+import warnings
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import PolyCollection
+
+# SciPy est optionnel : son arbre k-d accélère fortement la recherche du
+# point le plus proche, mais l'application fonctionne sans lui.
+try:
+    from scipy.spatial import cKDTree, Voronoi
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# pandas est optionnel : son lecteur CSV accélère la lecture des gros fichiers.
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+# CuPy est optionnel : s'il est installé avec un GPU NVIDIA utilisable, la
+# grille est calculée sur le GPU (USE_GPU peut être mis à False pour l'éviter).
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:  # cupy absent, ou pilote CUDA / GPU introuvable
+    CUPY_AVAILABLE = False
+USE_GPU = CUPY_AVAILABLE
+
+# Numba est optionnel : il compile le noyau de calcul de la grille.
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Nombre maximal de distances calculées simultanément (~16 Mo en float32)
+MAX_TILE_ELEMENTS = 4 * 1024 * 1024
+
+# Même limite pour le GPU, dont la mémoire est bien plus grande (~256 Mo)
+MAX_GPU_TILE_ELEMENTS = 64 * 1024 * 1024
+
+# Résolution par défaut des exports PNG (le SVG, vectoriel, n'en a pas besoin)
+EXPORT_DPI = 150
+
+# Au-delà de ce nombre de points, l'arbre k-d (O(log N) par pixel) devient
+# plus rapide que le noyau compilé en force brute (O(N) par pixel)
+KDTREE_MIN_POINTS = 200
+
+# Sans scipy ni numba, au-delà de ce nombre de points, la propagation par
+# sauts (JFA, coût indépendant de N) remplace le calcul de toutes les distances
+JFA_MIN_POINTS = 1500
+
+# Côté des tuiles carrées du noyau numba : 128 x 128 distances float32
+# (64 Ko) restent en cache L2 pendant tout le balayage des points
+TILE_SIZE = 128
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _voronoi_kernel(px, py, x, y, Z):
+        """
+        Noyau compilé : pour chaque pixel, cherche le point le plus proche.
+
+        La grille est découpée en tuiles de TILE_SIZE x TILE_SIZE pixels,
+        réparties sur les cœurs (prange). Pour chaque tuile, tous les points
+        sont balayés en mettant à jour les meilleures distances de la tuile,
+        qui restent en cache ; la boucle interne sur des pixels contigus est
+        vectorisable (SIMD). Le résultat est écrit dans Z, déjà alloué au bon type.
+        """
+        H, W = Z.shape
+        n_tiles_x = (W + TILE_SIZE - 1) // TILE_SIZE
+        n_tiles = ((H + TILE_SIZE - 1) // TILE_SIZE) * n_tiles_x
+        for t in prange(n_tiles):
+            y0 = (t // n_tiles_x) * TILE_SIZE
+            x0 = (t % n_tiles_x) * TILE_SIZE
+            h = min(TILE_SIZE, H - y0)
+            w = min(TILE_SIZE, W - x0)
+            best = np.empty((h, w), dtype=np.float32)
+            best_k = np.zeros((h, w), dtype=np.int32)
+
+            # Initialisation avec le premier point
+            for i in range(h):
+                dy = y[y0 + i] - py[0]
+                dy2 = dy * dy
+                for j in range(w):
+                    dx = x[x0 + j] - px[0]
+                    best[i, j] = dx * dx + dy2
+
+            for k in range(1, px.shape[0]):
+                for i in range(h):
+                    dy = y[y0 + i] - py[k]
+                    dy2 = dy * dy
+                    for j in range(w):
+                        dx = x[x0 + j] - px[k]
+                        d = dx * dx + dy2
+                        if d < best[i, j]:
+                            best[i, j] = d
+                            best_k[i, j] = k
+
+            for i in range(h):
+                for j in range(w):
+                    Z[y0 + i, x0 + j] = best_k[i, j]
+
+
+def _gpu_grid(points, x, y):
+    """
+    Calcule la carte des zones sur le GPU avec CuPy.
+
+    Même calcul que le repli numpy (tables séparables des distances au carré,
+    puis addition et argmin par bande de lignes), exécuté par des milliers de
+    cœurs CUDA. Seul le résultat est recopié vers la mémoire centrale.
+
+    Args:
+        points (np.ndarray): Tableau float32 des coordonnées des points (N, 2).
+        x (np.ndarray): Abscisses float32 des colonnes de la grille.
+        y (np.ndarray): Ordonnées float32 des lignes de la grille.
+
+    Returns:
+        np.ndarray: Matrice des indices du point le plus proche.
+    """
+    gpu_points = cp.asarray(points)
+    dx2 = (cp.asarray(x)[:, None] - gpu_points[:, 0])**2
+    dy2 = (cp.asarray(y)[:, None] - gpu_points[:, 1])**2
+
+    Z = cp.empty((len(y), len(x)), dtype=cp.int32)
+    tile = max(1, MAX_GPU_TILE_ELEMENTS // (len(x) * len(points)))
+    for y0 in range(0, len(y), tile):
+        Z[y0:y0 + tile] = (dy2[y0:y0 + tile, None, :] + dx2[None, :, :]).argmin(axis=-1)
+    return cp.asnumpy(Z)
+
+
+def _shift(labels, dy, dx):
+    """
+    Décale la matrice d'étiquettes de (dy, dx) pixels : le résultat en (i, j)
+    vaut labels[i + dy, j + dx], et -1 hors de la grille (pas de bouclage,
+    contrairement à np.roll).
+    """
+    H, W = labels.shape
+    out = np.full_like(labels, -1)
+    out[max(0, -dy):H - max(0, dy), max(0, -dx):W - max(0, dx)] = \
+        labels[max(0, dy):H - max(0, -dy), max(0, dx):W - max(0, -dx)]
+    return out
+
+
+def _jump_flood(points, x, y):
+    """
+    Approxime la carte des zones par l'algorithme de Jump Flooding (JFA).
+
+    Chaque point est déposé sur le pixel le plus proche, puis chaque passe
+    (pas R/2, R/4, ..., 1) propage les étiquettes en comparant chaque pixel
+    à ses 8 voisins situés à ±pas. Il n'y a que log2(R) passes, chacune faite
+    de quelques opérations numpy sur toute la grille : le coût est
+    O(R² log R), indépendant du nombre de points. Une passe finale de pas 1
+    (variante « JFA+1 ») corrige la plupart des pixels mal attribués.
+
+    Args:
+        points (np.ndarray): Tableau float32 des coordonnées des points (N, 2).
+        x (np.ndarray): Abscisses float32 des colonnes de la grille.
+        y (np.ndarray): Ordonnées float32 des lignes de la grille.
+
+    Returns:
+        np.ndarray: Matrice des indices du point le plus proche.
+    """
+    H, W = len(y), len(x)
+
+    # L'étiquette -1 (pixel pas encore atteint) désigne un point sentinelle à l'infini
+    px = np.append(points[:, 0], np.float32(np.inf))
+    py = np.append(points[:, 1], np.float32(np.inf))
+
+    # Taille d'un pixel ; une grille d'un seul pixel n'a pas d'étendue (division par zéro)
+    px_w = (x[-1] - x[0]) / max(W - 1, 1) or 1.0
+    px_h = (y[-1] - y[0]) / max(H - 1, 1) or 1.0
+    cols = np.rint((points[:, 0] - x[0]) / px_w).astype(np.intp)
+    rows = np.rint((points[:, 1] - y[0]) / px_h).astype(np.intp)
+    labels = np.full((H, W), -1, dtype=np.int32)
+    labels[np.clip(rows, 0, H - 1), np.clip(cols, 0, W - 1)] = np.arange(len(points))
+
+    def dist_sq(lbl):
+        return (x - px[lbl])**2 + (y[:, None] - py[lbl])**2
+
+    step = 1 << (max(H, W) - 1).bit_length() - 1 if max(H, W) > 1 else 1
+    steps = []
+    while step >= 1:
+        steps.append(step)
+        step //= 2
+    steps.append(1)
+
+    for step in steps:
+        best = labels.copy()
+        best_d = dist_sq(labels)
+        for dy in (-step, 0, step):
+            for dx in (-step, 0, step):
+                if dy == 0 and dx == 0:
+                    continue
+                candidate = _shift(labels, dy, dx)
+                d = dist_sq(candidate)
+                better = d < best_d
+                np.copyto(best, candidate, where=better)
+                np.minimum(best_d, d, out=best_d)
+        labels = best
+
+    return labels
+
+
+def _index_dtype(n_points):
+    """Plus petit type entier capable de stocker les indices de n_points points."""
+    if n_points <= 256:
+        return np.uint8
+    if n_points <= 32767:
+        return np.int16
+    return np.int32
 
 
 def parse_points_file(filepath):
@@ -11,12 +221,13 @@ def parse_points_file(filepath):
     Lit un fichier texte et extrait les coordonnées des points.
     
     Format attendu : une paire de coordonnées (x,y) par ligne, séparée par une virgule.
+    Les points en double sont ignorés (avec un avertissement).
     
     Args:
         filepath (str): Le chemin vers le fichier texte.
         
     Returns:
-        np.ndarray: Un tableau numpy de forme (N, 2) contenant les points.
+        np.ndarray: Un tableau numpy float32 de forme (N, 2) contenant les points.
         
     Raises:
         FileNotFoundError: Si le fichier n'existe pas.
@@ -25,6 +236,71 @@ def parse_points_file(filepath):
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"Le fichier '{filepath}' est introuvable.")
 
+    # Chemin rapide : lecture en C (pandas ou numpy). Si le fichier n'est pas
+    # parfaitement régulier (ligne mal formée, valeur non numérique...),
+    # la lecture ligne par ligne prend le relais et indique la ligne fautive.
+    points = _parse_points_fast(filepath)
+    if points is None:
+        points = _parse_points_line_by_line(filepath)
+
+    # Les doublons donneraient des zones vides et alourdiraient le calcul :
+    # on ne garde que la première occurrence de chaque point, dans l'ordre du fichier
+    _, first = np.unique(points, axis=0, return_index=True)
+    if len(first) < len(points):
+        warnings.warn(f"{len(points) - len(first)} point(s) en double ignoré(s).")
+        points = points[np.sort(first)]
+
+    if len(points) < 2:
+        raise ValueError("Le fichier doit contenir au moins 2 points pour générer un diagramme.")
+
+    return points
+
+
+def _parse_points_fast(filepath):
+    """
+    Lecture du fichier en un seul appel compilé.
+
+    Utilise le lecteur CSV de pandas s'il est installé (nettement plus rapide
+    pour des centaines de milliers de lignes), sinon np.loadtxt.
+
+    Args:
+        filepath (str): Le chemin vers le fichier texte.
+
+    Returns:
+        np.ndarray or None: Un tableau numpy float32 de forme (N, 2), ou None si
+        le fichier ne peut pas être lu ainsi.
+    """
+    try:
+        if PANDAS_AVAILABLE:
+            points = pd.read_csv(filepath, header=None, dtype=np.float32,
+                                 engine='c', encoding='utf-8').to_numpy()
+        else:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # numpy avertit quand le fichier est vide
+                points = np.loadtxt(filepath, delimiter=',', dtype=np.float32,
+                                    comments=None, ndmin=2, encoding='utf-8')
+    except ValueError:  # inclut les erreurs de lecture de pandas
+        return None
+
+    # pandas complète les lignes trop courtes par NaN au lieu d'échouer
+    if points.ndim != 2 or points.shape[1] != 2 or np.isnan(points).any():
+        return None
+    return points
+
+
+def _parse_points_line_by_line(filepath):
+    """
+    Lecture ligne par ligne, utilisée quand numpy ne peut pas analyser le fichier.
+
+    Args:
+        filepath (str): Le chemin vers le fichier texte.
+
+    Returns:
+        np.ndarray: Un tableau numpy float32 de forme (N, 2).
+
+    Raises:
+        ValueError: Si une ligne ne respecte pas le format x,y.
+    """
     points = []
     with open(filepath, 'r', encoding='utf-8') as f:
         for line_idx, line in enumerate(f):
@@ -43,16 +319,40 @@ def parse_points_file(filepath):
             except ValueError:
                 raise ValueError(f"Coordonnées non numériques ligne {line_idx + 1}.")
 
-    if len(points) < 2:
-        raise ValueError("Le fichier doit contenir au moins 2 points pour générer un diagramme.")
+    return np.array(points, dtype=np.float32).reshape(-1, 2)
 
-    return np.array(points)
+
+def bounding_box(points, padding=0.2):
+    """
+    Calcule la boîte englobante des points, élargie d'une marge.
+
+    Args:
+        points (np.ndarray): Tableau des coordonnées des points (N, 2).
+        padding (float): Marge autour des points extrêmes (en pourcentage de la taille).
+
+    Returns:
+        tuple: (x_start, x_end, y_start, y_end).
+    """
+    min_x, max_x = np.min(points[:, 0]), np.max(points[:, 0])
+    min_y, max_y = np.min(points[:, 1]), np.max(points[:, 1])
+
+    range_x = max_x - min_x if max_x > min_x else 1.0
+    range_y = max_y - min_y if max_y > min_y else 1.0
+
+    return (min_x - padding * range_x, max_x + padding * range_x,
+            min_y - padding * range_y, max_y + padding * range_y)
 
 
 def generate_voronoi_grid(points, resolution=800, padding=0.2):
     """
     Génère une grille discrète représentant le diagramme de Voronoï.
-    Utilise une approche de champ de distance minimisée pour éviter la dépendance à scipy.
+    Le calcul est fait sur GPU si CuPy est disponible (USE_GPU). Sinon, si
+    scipy est disponible, chaque pixel est associé à son point le plus proche
+    par une requête groupée dans un arbre k-d. Pour peu de points (ou sans
+    scipy), un noyau compilé par numba est utilisé. À défaut, beaucoup de
+    points sont traités par Jump Flooding (approximation dont le coût ne
+    dépend pas de N), et peu de points par un calcul numpy exact à partir de
+    tables séparables, bande de lignes par bande.
     
     Args:
         points (np.ndarray): Tableau des coordonnées des points (N, 2).
@@ -60,38 +360,140 @@ def generate_voronoi_grid(points, resolution=800, padding=0.2):
         padding (float): Marge autour des points extrêmes (en pourcentage de la taille).
         
     Returns:
-        tuple: (X, Y, Z) où X et Y sont les grilles de coordonnées, 
+        tuple: (X, Y, Z) où X et Y sont les grilles de coordonnées (vues en
+               lecture seule sur les axes 1-D, sans copie mémoire),
                et Z est la matrice des indices du point le plus proche.
     """
-    # Calcul de la boîte englobante (bounding box)
-    min_x, max_x = np.min(points[:, 0]), np.max(points[:, 0])
-    min_y, max_y = np.min(points[:, 1]), np.max(points[:, 1])
+    # float32 suffit largement pour des coordonnées de pixels et divise par
+    # deux la mémoire parcourue par rapport au float64
+    points = np.asarray(points, dtype=np.float32)
 
-    range_x = max_x - min_x if max_x > min_x else 1.0
-    range_y = max_y - min_y if max_y > min_y else 1.0
-
-    x_start, x_end = min_x - padding * range_x, max_x + padding * range_x
-    y_start, y_end = min_y - padding * range_y, max_y + padding * range_y
+    x_start, x_end, y_start, y_end = bounding_box(points, padding)
 
     # Création de la grille
-    x = np.linspace(x_start, x_end, resolution)
-    y = np.linspace(y_start, y_end, resolution)
-    X, Y = np.meshgrid(x, y)
+    x = np.linspace(x_start, x_end, resolution, dtype=np.float32)
+    y = np.linspace(y_start, y_end, resolution, dtype=np.float32)
+    # Pas de meshgrid : X et Y ne sont que des vues diffusées des axes 1-D,
+    # les calculs ci-dessous travaillent directement sur x et y
+    X = np.broadcast_to(x, (resolution, resolution))
+    Y = np.broadcast_to(y[:, None], (resolution, resolution))
+
+    # Indices des zones sur le plus petit type entier possible (uint8 jusqu'à 256 points)
+    Z = np.empty((resolution, resolution), dtype=_index_dtype(len(points)))
+
+    if USE_GPU:
+        Z[:] = _gpu_grid(points, x, y)
+        return X, Y, Z
 
-    # Initialisation de la carte des zones (Z) et des distances minimales
-    Z = np.zeros((resolution, resolution), dtype=int)
-    min_dists = np.full((resolution, resolution), np.inf)
+    if SCIPY_AVAILABLE and (len(points) > KDTREE_MIN_POINTS or not NUMBA_AVAILABLE):
+        # Une seule requête (en C, multi-thread) pour tous les pixels
+        tree = cKDTree(points)
+        pixels = np.column_stack((np.tile(x, resolution), np.repeat(y, resolution)))
+        _, idx = tree.query(pixels, k=1, workers=-1)
+        Z[:] = idx.reshape(resolution, resolution)
+        return X, Y, Z
 
-    # Optimisation mémoire et CPU : calcul itératif des distances au carré
-    for i, point in enumerate(points):
-        dist_sq = (X - point[0])**2 + (Y - point[1])**2
-        mask = dist_sq < min_dists
-        min_dists[mask] = dist_sq[mask]
-        Z[mask] = i
+    if NUMBA_AVAILABLE:
+        _voronoi_kernel(points[:, 0].copy(), points[:, 1].copy(), x, y, Z)
+        return X, Y, Z
+
+    if len(points) > JFA_MIN_POINTS:
+        Z[:] = _jump_flood(points, x, y)
+        return X, Y, Z
+
+    # Distance au carré séparable : d(i, j, k) = (x[j] - px[k])² + (y[i] - py[k])².
+    # Les deux termes ne dépendent que d'une colonne ou d'une ligne : ils sont
+    # précalculés une fois dans deux petites tables (résolution x N), et chaque
+    # bande de lignes se réduit à une seule addition diffusée suivie de l'argmin,
+    # sans soustraction ni carré sur le cube de distances.
+    dx2 = (x[:, None] - points[:, 0])**2
+    dy2 = (y[:, None] - points[:, 1])**2
+
+    tile = max(1, MAX_TILE_ELEMENTS // (resolution * len(points)))
+    for y0 in range(0, resolution, tile):
+        d = dy2[y0:y0 + tile, None, :] + dx2[None, :, :]
+        Z[y0:y0 + tile] = d.argmin(axis=-1)
 
     return X, Y, Z
 
 
+def generate_voronoi_polygons(points, padding=0.2):
+    """
+    Calcule les cellules de Voronoï exactes (polygones) avec scipy.
+
+    Au lieu d'évaluer un champ de distance sur des centaines de milliers de
+    pixels, Qhull construit le diagramme en O(N log N). Les points sont
+    reflétés de l'autre côté des quatre bords de la boîte englobante : les
+    cellules des points d'origine sont alors toutes fermées et correspondent
+    exactement à leur découpe par la boîte.
+
+    Args:
+        points (np.ndarray): Tableau des coordonnées des points (N, 2).
+        padding (float): Marge autour des points extrêmes (en pourcentage de la taille).
+
+    Returns:
+        tuple: (polygons, extent) où polygons est la liste des N polygones
+               (sommets de forme (M, 2)) dans l'ordre des points, et
+               extent = (x_start, x_end, y_start, y_end).
+
+    Raises:
+        ValueError: Si scipy n'est pas installé.
+    """
+    if not SCIPY_AVAILABLE:
+        raise ValueError("Le calcul des polygones nécessite scipy.")
+
+    points = np.asarray(points, dtype=np.float64)
+    extent = bounding_box(points, padding)
+    x_start, x_end, y_start, y_end = extent
+
+    mirrored = [points]
+    for axis, edge in ((0, x_start), (0, x_end), (1, y_start), (1, y_end)):
+        reflected = points.copy()
+        reflected[:, axis] = 2 * edge - reflected[:, axis]
+        mirrored.append(reflected)
+
+    vor = Voronoi(np.concatenate(mirrored))
+    polygons = [vor.vertices[vor.regions[vor.point_region[i]]] for i in range(len(points))]
+    return polygons, extent
+
+
+def zone_colors(n_zones, cmap_name='tab20', alpha=0.6):
+    """
+    Couleurs RGBA (0-1) des n_zones premières zones, identiques à celles de zones_to_rgba.
+
+    Args:
+        n_zones (int): Nombre de zones.
+        cmap_name (str): Nom d'une palette qualitative matplotlib.
+        alpha (float): Opacité des zones.
+
+    Returns:
+        np.ndarray: Tableau de forme (n_zones, 4).
+    """
+    return zones_to_rgba(np.arange(n_zones), cmap_name, alpha) / 255
+
+
+def zones_to_rgba(Z, cmap_name='tab20', alpha=0.6):
+    """
+    Convertit la matrice des zones en image RGBA 8 bits prête pour imshow.
+
+    Les couleurs sont lues dans une table (LUT) construite une seule fois à partir
+    de la palette : matplotlib n'a plus ni normalisation ni colormap à appliquer
+    lors de l'affichage.
+
+    Args:
+        Z (np.ndarray): Matrice des indices du point le plus proche.
+        cmap_name (str): Nom d'une palette qualitative matplotlib.
+        alpha (float): Opacité des zones.
+
+    Returns:
+        np.ndarray: Image uint8 de forme (H, W, 4).
+    """
+    cmap = plt.get_cmap(cmap_name)
+    lut = (cmap(np.arange(cmap.N)) * 255).astype(np.uint8)
+    lut[:, 3] = round(alpha * 255)
+    return lut[Z % cmap.N]
+
+
 class VoronoiApp:
     """Interface utilisateur principale pour l'application Voronoï."""
     
@@ -103,6 +505,14 @@ class VoronoiApp:
         self.points = None
         self.fig, self.ax = plt.subplots(figsize=(8, 6))
         
+        # Avec scipy, les zones sont dessinées comme polygones exacts ;
+        # sinon, comme image issue de la grille de pixels
+        self._use_polygons = SCIPY_AVAILABLE
+        # (points, (extent, polygones ou image RGBA)) du dernier diagramme calculé
+        self._voronoi_cache = (None, None)
+        self._zones = None
+        self._points_line = None
+        
         self.create_widgets()
 
     def create_widgets(self):
@@ -137,44 +547,83 @@ class VoronoiApp:
             return
 
         try:
-            self.points = parse_points_file(filepath)
+            # Les avertissements de lecture (points en double ignorés) sont
+            # enregistrés pour être montrés à l'utilisateur
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                self.points = parse_points_file(filepath)
+            self._voronoi_cache = (None, None)
             self.plot_voronoi()
             self.btn_png.config(state=tk.NORMAL)
             self.btn_svg.config(state=tk.NORMAL)
         except Exception as e:
             messagebox.showerror("Erreur de chargement", str(e))
+            return
+
+        if caught:
+            messagebox.showwarning("Avertissement", "\n".join(str(w.message) for w in caught))
 
     def plot_voronoi(self):
-        """Génère la grille et affiche le diagramme sur le canevas Matplotlib."""
-        self.ax.clear()
-        self.ax.set_title("Génération en cours...")
-        self.canvas.draw()
-        
-        # Génération
-        X, Y, Z = generate_voronoi_grid(self.points)
-        
-        # Affichage
-        self.ax.clear()
-        self.ax.imshow(
-            Z, 
-            extent=(X.min(), X.max(), Y.min(), Y.max()), 
-            origin='lower',
-            cmap='tab20', 
-            alpha=0.6, 
-            aspect='auto'
-        )
-        self.ax.plot(self.points[:, 0], self.points[:, 1], 'ko', markersize=5, label='Points')
+        """Génère le diagramme et l'affiche sur le canevas Matplotlib."""
+        # Le diagramme n'est recalculé que si les points ont changé
+        if self._voronoi_cache[0] is not self.points:
+            self.ax.set_title("Génération en cours...")
+            self.canvas.draw()
+
+            if self._use_polygons:
+                zones, extent = generate_voronoi_polygons(self.points)
+            else:
+                X, Y, Z = generate_voronoi_grid(self.points)
+                extent = (X[0, 0], X[0, -1], Y[0, 0], Y[-1, 0])
+                zones = zones_to_rgba(Z)
+            self._voronoi_cache = (self.points, (extent, zones))
+
+        extent, zones = self._voronoi_cache[1]
+
+        # Affichage : les artistes sont créés une seule fois, puis mis à jour
+        if self._zones is None:
+            self.ax.clear()
+            self.ax.axis('on')
+            if self._use_polygons:
+                self._zones = PolyCollection(zones, facecolors=zone_colors(len(zones)), edgecolors='none')
+                self.ax.add_collection(self._zones)
+            else:
+                self._zones = self.ax.imshow(
+                    zones, 
+                    extent=extent, 
+                    origin='lower',
+                    aspect='auto'
+                )
+            self._points_line, = self.ax.plot(self.points[:, 0], self.points[:, 1], 'ko', markersize=5, label='Points')
+            self.ax.set_xlabel("X")
+            self.ax.set_ylabel("Y")
+            self.ax.legend(loc='upper right')
+        else:
+            if self._use_polygons:
+                self._zones.set_verts(zones)
+                self._zones.set_facecolor(zone_colors(len(zones)))
+            else:
+                self._zones.set_data(zones)
+                self._zones.set_extent(extent)
+            self._points_line.set_data(self.points[:, 0], self.points[:, 1])
+
+        if self._use_polygons:
+            self.ax.set_xlim(extent[0], extent[1])
+            self.ax.set_ylim(extent[2], extent[3])
         
         self.ax.set_title("Diagramme de Voronoï")
-        self.ax.set_xlabel("X")
-        self.ax.set_ylabel("Y")
-        self.ax.legend(loc='upper right')
-        
         self.fig.tight_layout()
         self.canvas.draw()
 
-    def export_image(self, fmt):
-        """Exporte le graphique affiché dans le format souhaité (png ou svg)."""
+    def export_image(self, fmt, dpi=EXPORT_DPI):
+        """
+        Exporte le graphique affiché dans le format souhaité (png ou svg).
+
+        Le SVG est vectoriel : ni résolution ni recadrage à calculer. Le PNG est
+        rendu à `dpi` points par pouce, sans recadrage 'tight' (la mise en page
+        est déjà ajustée par tight_layout à chaque affichage), ce qui évite une
+        seconde passe de rendu.
+        """
         if self.points is None:
             return
             
@@ -185,7 +634,10 @@ class VoronoiApp:
         
         if filepath:
             try:
-                self.fig.savefig(filepath, format=fmt, dpi=300, bbox_inches='tight')
+                if fmt == 'svg':
+                    self.fig.savefig(filepath, format='svg')
+                else:
+                    self.fig.savefig(filepath, format=fmt, dpi=dpi)
                 messagebox.showinfo("Succès", f"Fichier exporté avec succès sous :\n{filepath}")
             except Exception as e:
                 messagebox.showerror("Erreur d'exportation", f"Impossible de sauvegarder : {str(e)}")
@@ -1,6 +1,8 @@
+import warnings
 import pytest
 import numpy as np
-from main import parse_points_file, generate_voronoi_grid
+from main import parse_points_file, generate_voronoi_grid, generate_voronoi_polygons, zones_to_rgba
+
 
 def test_parse_points_file_valid(tmp_path):
     """Teste la lecture d'un fichier valide avec des entiers et des flottants."""
@@ -13,11 +15,13 @@ def test_parse_points_file_valid(tmp_path):
     assert np.allclose(points[0], [2.0, 4.0])
     assert np.allclose(points[1], [5.3, 4.5])
 
+
 def test_parse_points_file_not_found():
     """Teste le déclenchement de l'erreur si le fichier n'existe pas."""
     with pytest.raises(FileNotFoundError, match="introuvable"):
         parse_points_file("chemin_inexistant.txt")
 
+
 def test_parse_points_file_invalid_format(tmp_path):
     """Teste la détection de lignes qui ne sont pas des coordonnées (x,y)."""
     file = tmp_path / "bad_points.txt"
@@ -26,6 +30,7 @@ def test_parse_points_file_invalid_format(tmp_path):
     with pytest.raises(ValueError, match="Coordonnées non numériques"):
         parse_points_file(str(file))
 
+
 def test_parse_points_file_too_few_elements(tmp_path):
     """Teste la détection de lignes ne contenant qu'une seule valeur."""
     file = tmp_path / "bad_points_2.txt"
@@ -34,6 +39,7 @@ def test_parse_points_file_too_few_elements(tmp_path):
     with pytest.raises(ValueError, match="Format incorrect"):
         parse_points_file(str(file))
 
+
 def test_parse_points_file_not_enough_points(tmp_path):
     """Teste la gestion des fichiers contenant moins de 2 points."""
     file = tmp_path / "short_points.txt"
@@ -42,6 +48,7 @@ def test_parse_points_file_not_enough_points(tmp_path):
     with pytest.raises(ValueError, match="au moins 2 points"):
         parse_points_file(str(file))
 
+
 def test_generate_voronoi_grid():
     """Teste la génération de la matrice de Voronoï sur des points simples."""
     points = np.array([[0, 0], [10, 10]])
@@ -59,10 +66,164 @@ def test_generate_voronoi_grid():
     # En haut à droite, la valeur doit appartenir au point 1.
     assert Z[-1, -1] == 1
 
+
 def test_generate_voronoi_grid_aligned():
     """Teste que l'algorithme ne crashe pas sur des points alignés."""
     points = np.array([[1, 1], [2, 1], [3, 1]])
     X, Y, Z = generate_voronoi_grid(points, resolution=50)
     assert Z.shape == (50, 50)
     # On s'assure que les 3 zones ont bien été générées
-    assert len(np.unique(Z)) == 3
\ No newline at end of file
+    assert len(np.unique(Z)) == 3
+
+
+def test_generate_voronoi_grid_kdtree_matches_loop(monkeypatch):
+    """Teste que la recherche par arbre k-d donne les mêmes zones que le calcul direct."""
+    pytest.importorskip("scipy")
+    import main
+    points = np.random.default_rng(0).uniform(0, 100, size=(40, 2))
+    monkeypatch.setattr(main, "KDTREE_MIN_POINTS", 0)
+    _, _, Z_tree = generate_voronoi_grid(points, resolution=100)
+
+    monkeypatch.setattr(main, "SCIPY_AVAILABLE", False)
+    _, _, Z_loop = generate_voronoi_grid(points, resolution=100)
+
+    assert np.array_equal(Z_tree, Z_loop)
+
+
+def test_generate_voronoi_grid_numba_matches_numpy(monkeypatch):
+    """Teste que le noyau compilé par numba donne les mêmes zones que numpy."""
+    pytest.importorskip("numba")
+    import main
+    points = np.random.default_rng(1).uniform(0, 100, size=(25, 2))
+    monkeypatch.setattr(main, "SCIPY_AVAILABLE", False)
+    _, _, Z_numba = generate_voronoi_grid(points, resolution=100)
+
+    monkeypatch.setattr(main, "NUMBA_AVAILABLE", False)
+    _, _, Z_numpy = generate_voronoi_grid(points, resolution=100)
+
+    assert np.array_equal(Z_numba, Z_numpy)
+
+
+def test_generate_voronoi_grid_compact_dtypes():
+    """Teste que la grille utilise des types compacts (float32, uint8 ou int16)."""
+    X, Y, Z = generate_voronoi_grid(np.array([[0, 0], [10, 10]]), resolution=10)
+    assert X.dtype == np.float32
+    assert Z.dtype == np.uint8
+
+    points = np.random.default_rng(2).uniform(0, 100, size=(300, 2))
+    _, _, Z = generate_voronoi_grid(points, resolution=20)
+    assert Z.dtype == np.int16
+
+
+def test_generate_voronoi_grid_coordinates():
+    """Teste que X et Y donnent bien les coordonnées de chaque pixel."""
+    points = np.array([[0, 0], [10, 20]])
+    X, Y, Z = generate_voronoi_grid(points, resolution=5, padding=0)
+    assert np.allclose(X[3], np.linspace(0, 10, 5))
+    assert np.allclose(Y[:, 1], np.linspace(0, 20, 5))
+
+
+def test_parse_points_file_blank_lines(tmp_path):
+    """Teste que les lignes vides (même avec des espaces) sont ignorées."""
+    file = tmp_path / "points.txt"
+    file.write_text("2,4\n   \n5.3,4.5\n\n")
+
+    points = parse_points_file(str(file))
+
+    assert points.shape == (2, 2)
+    assert np.allclose(points[1], [5.3, 4.5])
+
+
+def test_zones_to_rgba():
+    """Teste la conversion des zones en image RGBA 8 bits."""
+    Z = np.array([[0, 1], [2, 21]], dtype=np.int16)
+    rgba = zones_to_rgba(Z, alpha=0.6)
+
+    assert rgba.shape == (2, 2, 4)
+    assert rgba.dtype == np.uint8
+    assert np.all(rgba[..., 3] == 153)
+    # La palette tab20 a 20 couleurs : la zone 21 reprend la couleur de la zone 1
+    assert np.array_equal(rgba[1, 1], rgba[0, 1])
+    assert not np.array_equal(rgba[0, 0], rgba[0, 1])
+
+
+def test_parse_points_file_without_pandas(tmp_path, monkeypatch):
+    """Teste la lecture (et les erreurs) avec le repli numpy quand pandas est absent."""
+    import main
+    monkeypatch.setattr(main, "PANDAS_AVAILABLE", False)
+    file = tmp_path / "points.txt"
+    file.write_text("2,4\n5.3,4.5\n")
+    assert np.allclose(parse_points_file(str(file)), [[2, 4], [5.3, 4.5]])
+
+    file.write_text("2,4\n5.3\n18,29")
+    with pytest.raises(ValueError, match="Format incorrect"):
+        parse_points_file(str(file))
+
+
+def test_generate_voronoi_polygons():
+    """Teste que les polygones pavent la boîte englobante et contiennent chacun leur point."""
+    pytest.importorskip("scipy")
+    from matplotlib.path import Path
+    points = np.random.default_rng(3).uniform(0, 100, size=(20, 2))
+    polygons, (x_start, x_end, y_start, y_end) = generate_voronoi_polygons(points)
+
+    assert len(polygons) == len(points)
+    area = sum(0.5 * abs(np.dot(p[:, 0], np.roll(p[:, 1], 1)) - np.dot(p[:, 1], np.roll(p[:, 0], 1)))
+               for p in polygons)
+    assert area == pytest.approx((x_end - x_start) * (y_end - y_start))
+    for polygon, point in zip(polygons, points):
+        assert Path(polygon).contains_point(point)
+
+
+def test_generate_voronoi_grid_gpu_matches_cpu(monkeypatch):
+    """Teste que le calcul sur GPU (CuPy) donne les mêmes zones que le calcul sur CPU."""
+    import main
+    if not main.CUPY_AVAILABLE:
+        pytest.skip("CuPy ou GPU indisponible")
+    points = np.random.default_rng(5).uniform(0, 100, size=(25, 2))
+    _, _, Z_gpu = generate_voronoi_grid(points, resolution=100)
+
+    monkeypatch.setattr(main, "USE_GPU", False)
+    _, _, Z_cpu = generate_voronoi_grid(points, resolution=100)
+
+    assert np.array_equal(Z_gpu, Z_cpu)
+
+
+def test_parse_points_file_duplicates(tmp_path):
+    """Teste que les points en double sont ignorés, avec un avertissement."""
+    file = tmp_path / "points.txt"
+    file.write_text("5,5\n1,2\n5,5\n3,4\n1,2\n")
+
+    with pytest.warns(UserWarning, match="2 point"):
+        points = parse_points_file(str(file))
+
+    # L'ordre du fichier est conservé
+    assert np.allclose(points, [[5, 5], [1, 2], [3, 4]])
+
+
+def test_generate_voronoi_grid_jump_flood(monkeypatch):
+    """Teste que l'approximation par Jump Flooding reste proche du calcul exact."""
+    import main
+    points = np.random.default_rng(6).uniform(0, 100, size=(300, 2))
+    monkeypatch.setattr(main, "SCIPY_AVAILABLE", False)
+    monkeypatch.setattr(main, "NUMBA_AVAILABLE", False)
+    _, _, Z_exact = generate_voronoi_grid(points, resolution=200)
+
+    monkeypatch.setattr(main, "JFA_MIN_POINTS", 0)
+    _, _, Z_jfa = generate_voronoi_grid(points, resolution=200)
+
+    assert Z_jfa.dtype == Z_exact.dtype
+    assert np.mean(Z_jfa == Z_exact) > 0.98
+
+
+def test_generate_voronoi_grid_jump_flood_single_pixel(monkeypatch):
+    """Teste que le Jump Flooding accepte une grille d'un seul pixel."""
+    import main
+    monkeypatch.setattr(main, "SCIPY_AVAILABLE", False)
+    monkeypatch.setattr(main, "NUMBA_AVAILABLE", False)
+    monkeypatch.setattr(main, "JFA_MIN_POINTS", 0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        _, _, Z = generate_voronoi_grid(np.array([[0, 0], [10, 10]]), resolution=1)
+    assert Z.shape == (1, 1)
+    assert Z[0, 0] in (0, 1)
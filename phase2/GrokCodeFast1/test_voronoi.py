@@ -3,7 +3,10 @@ import pytest
 import tempfile
 import os
 from unittest.mock import patch
-from voronoi_app import load_points, generate_voronoi, plot_voronoi, export_voronoi
+import matplotlib.pyplot as plt
+from matplotlib.path import Path
+from voronoi_app import (load_points, compute_regions, voronoi_regions, compute_region,
+                         plot_voronoi, export_voronoi, MAX_NEIGHBORS)
 
 ## Code GrockCodeFast1
 
@@ -66,11 +69,56 @@ class TestLoadPoints:
 
 class TestGenerateVoronoi:
     def test_generation(self):
-        """Test génération du Voronoï."""
+        """Test génération des régions du Voronoï."""
         points = np.array([[0, 0], [1, 0], [0, 1]])
-        vor = generate_voronoi(points)
-        assert vor is not None
-        assert len(vor.vertices) > 0  # Vérifie que des sommets sont générés
+        regions = compute_regions(points)
+        assert len(regions) == len(points)
+        assert all(region is not None for region in regions)  # Vérifie que des sommets sont générés
+
+    def test_degenerate_points(self):
+        """Test que 2 points ou des points alignés ne font pas échouer la génération."""
+        for points in (np.array([[0, 0], [1, 1]]), np.array([[0, 0], [1, 1], [2, 2]])):
+            regions = compute_regions(points)
+            assert len(regions) == len(points)
+
+
+class TestVoronoiRegions:
+    def test_regions_tile_bounding_box(self):
+        """Test que les régions exactes pavent la boîte englobante."""
+        pytest.importorskip("scipy")
+        points = np.random.default_rng(0).uniform(0, 10, size=(30, 2))
+        regions = voronoi_regions(points)
+        assert len(regions) == len(points)
+
+        def area(poly):
+            x, y = poly[:, 0], poly[:, 1]
+            return 0.5 * abs(np.dot(x, np.roll(y, 1)) - np.dot(y, np.roll(x, 1)))
+
+        span = np.ptp(points, axis=0) * 1.2
+        assert sum(area(r) for r in regions) == pytest.approx(span[0] * span[1])
+
+        # Chaque point est à l'intérieur de sa propre région
+        for point, region in zip(points, regions):
+            assert Path(region).contains_point(point)
+
+    def test_duplicate_points(self):
+        """Test que des points confondus ne reçoivent la région qu'une seule fois."""
+        pytest.importorskip("scipy")
+        regions = voronoi_regions(np.array([[10, 10], [40, 30], [10, 10]]))
+        assert len(regions[0]) > 2
+        assert len(regions[2]) == 0
+
+
+class TestComputeRegion:
+    def test_far_points_ignored(self):
+        """Test que seuls les voisins les plus proches sont utilisés."""
+        rng = np.random.default_rng(1)
+        close = rng.uniform(-1, 1, size=(MAX_NEIGHBORS, 2))
+        far = rng.uniform(100, 200, size=(10, 2))
+        point = np.array([0.05, 0.05])
+        expected = compute_region(point, close)
+        region = compute_region(point, np.vstack([close, far]))
+        assert np.allclose(region, expected)
 
 
 class TestPlotVoronoi:
@@ -78,18 +126,16 @@ class TestPlotVoronoi:
     def test_plot(self, mock_gca):
         """Test tracé du Voronoï (mocké pour éviter affichage)."""
         points = np.array([[0, 0], [1, 0], [0, 1]])
-        vor = generate_voronoi(points)
-        plot_voronoi(vor, points)
+        plot_voronoi(points)
         mock_gca.assert_called()
 
 
 class TestExportVoronoi:
-    @patch('matplotlib.pyplot.savefig')
-    @patch('matplotlib.pyplot.close')
-    def test_export(self, mock_close, mock_savefig):
-        """Test export (mocké pour éviter écriture fichier)."""
+    @patch('matplotlib.figure.Figure.savefig')
+    def test_export(self, mock_savefig):
+        """Test export (mocké pour éviter écriture fichier), sans figure pyplot."""
         points = np.array([[0, 0], [1, 0], [0, 1]])
-        vor = generate_voronoi(points)
-        export_voronoi(vor, points, "test", "svg")
+        figures = plt.get_fignums()
+        export_voronoi(points, "test", "svg")
         mock_savefig.assert_called_with("test.svg", format="svg", bbox_inches='tight')
-        mock_close.assert_called()
\ No newline at end of file
+        assert plt.get_fignums() == figures
\ No newline at end of file
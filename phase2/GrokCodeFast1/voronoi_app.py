@@ -1,10 +1,32 @@
+import multiprocessing
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.cm as cm
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
+# SciPy est optionnel : il fournit le diagramme de Voronoï exact (Qhull).
+# Sans lui, l'application se contente de l'approximation par bissectrices.
+try:
+    from scipy.spatial import Voronoi
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# Titre de la fenêtre et des figures : les régions ne sont exactes qu'avec scipy
+TITLE = "Diagramme de Voronoï" if SCIPY_AVAILABLE else "Approximation du Diagramme de Voronoï"
+
+# Nombre de voisins les plus proches considérés par compute_region : les
+# bissectrices des points plus lointains ne touchent pas la région en pratique
+MAX_NEIGHBORS = 16
+
 
 def load_points(filename):
     """
@@ -24,46 +46,89 @@ def load_points(filename):
         ValueError: Si le format est incorrect ou s'il y a moins de 2 points.
     """
     try:
-        points = []
-        with open(filename, 'r') as f:
-            for line_num, line in enumerate(f, start=1):
-                line = line.strip()
-                if not line:  # Ignore les lignes vides
-                    continue
-                parts = line.split(',')
-                if len(parts) != 2:
-                    raise ValueError(f"Ligne {line_num}: Doit contenir exactement deux valeurs séparées par une virgule.")
-                try:
-                    x, y = float(parts[0].strip()), float(parts[1].strip())
-                    points.append((x, y))
-                except ValueError:
-                    raise ValueError(f"Ligne {line_num}: Valeurs non numériques.")
+        # Lecture rapide en C par numpy ; si le fichier n'est pas parfaitement
+        # régulier, la lecture ligne par ligne ci-dessous indique la ligne fautive.
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # numpy avertit quand le fichier est vide
+                points = np.loadtxt(filename, delimiter=',', comments=None, ndmin=2)
+        except ValueError:
+            points = None
+        if points is None or points.shape[1] != 2:
+            points = []
+            with open(filename, 'r') as f:
+                for line_num, line in enumerate(f, start=1):
+                    line = line.strip()
+                    if not line:  # Ignore les lignes vides
+                        continue
+                    parts = line.split(',')
+                    if len(parts) != 2:
+                        raise ValueError(f"Ligne {line_num}: Doit contenir exactement deux valeurs séparées par une virgule.")
+                    try:
+                        x, y = float(parts[0].strip()), float(parts[1].strip())
+                        points.append((x, y))
+                    except ValueError:
+                        raise ValueError(f"Ligne {line_num}: Valeurs non numériques.")
+            points = np.array(points)
         if len(points) < 2:
             raise ValueError("Au moins 2 points sont requis pour générer un diagramme de Voronoï.")
-        return np.array(points)
+        return points
     except FileNotFoundError:
         raise FileNotFoundError("Le fichier spécifié est introuvable.")
     except Exception as e:
         raise ValueError(f"Erreur lors du chargement : {str(e)}")
 
 
-def generate_voronoi(points):
+def voronoi_regions(points, padding=0.1):
     """
-    Placeholder pour compatibilité – le calcul est fait dans plot_voronoi.
+    Construit les régions exactes du diagramme, découpées par la boîte englobante des points.
+
+    Les points sont reflétés de l'autre côté des quatre bords de la boîte : dans le
+    diagramme de ces 5N points, les régions des points d'origine sont toutes fermées
+    et correspondent exactement à leur découpe par la boîte (pas d'arêtes infinies
+    à prolonger ni de polygones à tronquer). Contrairement au diagramme des seuls
+    points d'origine, cela fonctionne aussi pour 2 points ou des points alignés.
+
+    Des points confondus partagent la même région : seule la première occurrence
+    la reçoit, les suivantes ont une région vide (sinon le même polygone serait
+    dessiné plusieurs fois, dans des couleurs différentes).
 
     Args:
         points (np.ndarray): Tableau des points.
+        padding (float): Marge autour des points, en fraction de leur étendue.
 
     Returns:
-        None
+        list: Sommets (shape: (m, 2)) de la région de chaque point, dans l'ordre des points.
     """
-    return None
+    points = np.asarray(points, dtype=float)
+    lo, hi = points.min(axis=0), points.max(axis=0)
+    margin = np.maximum(hi - lo, 1.0) * padding
+    lo, hi = lo - margin, hi + margin
+
+    mirrored = [points]
+    for axis in (0, 1):
+        for edge in (lo[axis], hi[axis]):
+            reflected = points.copy()
+            reflected[:, axis] = 2 * edge - reflected[:, axis]
+            mirrored.append(reflected)
+    full = Voronoi(np.concatenate(mirrored))
+
+    cells = full.point_region[:len(points)]
+    _, first = np.unique(cells, return_index=True)
+    regions = [np.empty((0, 2))] * len(points)
+    for i in first:
+        regions[i] = full.vertices[full.regions[cells[i]]]
+    return regions
 
 
 def line_intersection(p1, d1, p2, d2):
     """
     Calcule l'intersection de deux lignes définies par un point et une direction.
 
+    Le système 2x2 p1 + t·d1 = p2 + s·d2 est résolu par la règle de Cramer
+    (formule explicite, sans appel à LAPACK). Les arguments peuvent aussi être
+    des tableaux (m, 2) : les m systèmes sont alors résolus d'un seul coup.
+
     Args:
         p1 (np.ndarray): Point sur la première ligne.
         d1 (np.ndarray): Direction de la première ligne.
@@ -72,14 +137,21 @@ def line_intersection(p1, d1, p2, d2):
 
     Returns:
         np.ndarray or None: Point d'intersection, ou None si parallèle.
+        Pour des tableaux : les intersections (k, 2) des seules lignes non parallèles.
+        Les directions n'ont pas besoin d'être normalisées.
     """
-    A = np.array([d1, -d2]).T
+    p1, d1, p2, d2 = (np.asarray(a, dtype=float) for a in (p1, d1, p2, d2))
+    det = d1[..., 1] * d2[..., 0] - d1[..., 0] * d2[..., 1]
+    # Test de parallélisme indépendant de la longueur des directions :
+    # |det| = |d1|·|d2|·|sin(angle)|, comparé sans racine carrée
+    valid = det**2 > 1e-24 * (d1**2).sum(axis=-1) * (d2**2).sum(axis=-1)
     b = p2 - p1
-    try:
-        ts = np.linalg.solve(A, b)
-        return p1 + ts[0] * d1
-    except np.linalg.LinAlgError:
-        return None
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (b[..., 1] * d2[..., 0] - b[..., 0] * d2[..., 1]) / det
+        inter = p1 + t[..., None] * d1
+    if inter.ndim == 1:
+        return inter if valid else None
+    return inter[valid]
 
 
 def compute_region(point, points):
@@ -87,6 +159,8 @@ def compute_region(point, points):
     Calcule les sommets approximatifs de la région de Voronoï pour un point.
 
     Utilise les intersections des bissectrices avec les voisins pour former un polygone.
+    Seuls les MAX_NEIGHBORS voisins les plus proches sont pris en compte, ce qui
+    ramène le nombre d'intersections de O(n²) à O(1) par point.
 
     Args:
         point (np.ndarray): Le point central.
@@ -95,84 +169,139 @@ def compute_region(point, points):
     Returns:
         np.ndarray or None: Sommets du polygone, triés autour du point, ou None.
     """
-    neighbors = [p for p in points if not np.allclose(p, point)]
-    vertices = []
-    for i in range(len(neighbors)):
-        for j in range(i+1, len(neighbors)):
-            p1 = neighbors[i]
-            p2 = neighbors[j]
-            mid1 = (point + p1) / 2
-            dir1 = p1 - point
-            perp1 = np.array([-dir1[1], dir1[0]])
-            perp1 = perp1 / np.linalg.norm(perp1)
-            mid2 = (point + p2) / 2
-            dir2 = p2 - point
-            perp2 = np.array([-dir2[1], dir2[0]])
-            perp2 = perp2 / np.linalg.norm(perp2)
-            inter = line_intersection(mid1, perp1, mid2, perp2)
-            if inter is not None:
-                vertices.append(inter)
-    if vertices:
-        # Trier les vertices autour du point par angle
-        angles = [np.angle((v - point)[0] + 1j * (v - point)[1]) for v in vertices]
-        sorted_indices = np.argsort(angles)
-        sorted_vertices = [vertices[i] for i in sorted_indices]
-        return np.array(sorted_vertices)
+    points = np.asarray(points, dtype=float)
+    # Masque booléen plutôt qu'un np.allclose par point
+    neighbors = points[np.any(points != point, axis=1)]
+    if len(neighbors) > MAX_NEIGHBORS:
+        # Seuls les voisins proches délimitent la région : on ne garde que les
+        # MAX_NEIGHBORS plus proches (sélection partielle en O(n), sans tri complet)
+        dist2 = ((neighbors - point)**2).sum(axis=1)
+        neighbors = neighbors[np.sort(np.argpartition(dist2, MAX_NEIGHBORS)[:MAX_NEIGHBORS])]
+    # Bissectrices de tous les voisins, puis intersection de toutes les paires d'un coup.
+    # La direction d'une bissectrice n'a pas besoin d'être unitaire : pas de normalisation
+    mids = (point + neighbors) / 2
+    dirs = neighbors - point
+    perps = np.column_stack([-dirs[:, 1], dirs[:, 0]])
+    i, j = np.triu_indices(len(neighbors), 1)
+    vertices = line_intersection(mids[i], perps[i], mids[j], perps[j])
+    if len(vertices):
+        # Trier les vertices autour du point par angle (un seul arctan2 vectorisé)
+        d = vertices - point
+        return vertices[np.argsort(np.arctan2(d[:, 1], d[:, 0]))]
     return None
 
 
-def plot_voronoi(points, ax=None):
+@lru_cache(maxsize=16)
+def _rainbow(n):
+    """Couleurs (n, 4) des régions, calculées une seule fois par nombre de points (lecture seule)."""
+    colors = cm.rainbow(np.linspace(0, 1, n))
+    colors.setflags(write=False)
+    return colors
+
+
+def compute_regions(points):
+    """
+    Calcule les régions de tous les points : exactes avec scipy, approximées sinon.
+
+    Args:
+        points (np.ndarray): Tableau des points.
+
+    Returns:
+        list: Sommets de la région de chaque point (ou None), dans l'ordre des points.
     """
-    Trace une approximation du diagramme de Voronoï avec zones colorées et points.
+    if SCIPY_AVAILABLE:
+        return voronoi_regions(points)
+    return [compute_region(point, points) for point in points]
 
-    Calcule et remplit les régions approximatives pour chaque point avec une couleur unique.
+
+def plot_voronoi(points, ax=None, regions=None):
+    """
+    Trace le diagramme de Voronoï avec zones colorées et points.
+
+    Remplit la région de chaque point avec une couleur unique et trace les contours
+    d'un seul coup (PolyCollection). Les régions sont calculées par compute_regions
+    si elles ne sont pas fournies : exactes avec scipy, approximées sinon.
 
     Args:
         points (np.ndarray): Tableau des points.
         ax (matplotlib.axes.Axes, optional): Axe pour tracer.
+        regions (list, optional): Régions déjà calculées (par exemple par un tracé
+            précédent) ; elles sont alors réutilisées telles quelles.
+
+    Returns:
+        list: Les régions tracées, à repasser aux tracés suivants des mêmes points.
     """
     if ax is None:
         ax = plt.gca()
 
-    colors = cm.rainbow(np.linspace(0, 1, len(points)))
-    for i, point in enumerate(points):
-        region = compute_region(point, points)
-        if region is not None and len(region) > 2:
-            # Fermer le polygone pour fill
-            region_closed = np.vstack([region, region[0]])
-            ax.fill(region_closed[:, 0], region_closed[:, 1], color=colors[i], alpha=0.5)
-            # Tracer le contour noir
-            ax.plot(region_closed[:, 0], region_closed[:, 1], 'k-')
+    colors = _rainbow(len(points))
+    if regions is None:
+        regions = compute_regions(points)
+
+    # Une seule collection pour toutes les régions : remplissage semi-transparent
+    # (alpha porté par les couleurs de face) et contours noirs opaques
+    keep = [i for i, region in enumerate(regions) if region is not None and len(region) > 2]
+    if keep:
+        facecolors = colors[keep]
+        facecolors[:, 3] = 0.5
+        ax.add_collection(PolyCollection([regions[i] for i in keep], facecolors=facecolors,
+                                         edgecolors='k', linewidths=0.8))
+        ax.autoscale_view()
 
     # Tracer les points rouges
     ax.plot(points[:, 0], points[:, 1], 'ro')
     ax.set_aspect('equal')
+    return regions
 
 
-def export_voronoi(points, filename, format_type):
+def export_voronoi(points, filename, format_type, regions=None):
     """
-    Exporte l'approximation du diagramme de Voronoï en SVG ou PNG.
+    Exporte le diagramme de Voronoï en SVG ou PNG.
 
     Args:
         points (np.ndarray): Tableau des points.
         filename (str): Nom du fichier de sortie (sans extension).
         format_type (str): 'svg' ou 'png'.
+        regions (list, optional): Régions déjà calculées, réutilisées par plot_voronoi.
     """
-    fig, ax = plt.subplots()
-    plot_voronoi(points, ax)
-    plt.title("Approximation du Diagramme de Voronoï")
-    plt.savefig(f"{filename}.{format_type}", format=format_type, bbox_inches='tight')
-    plt.close(fig)
+    # Figure autonome rendue par Agg : rien n'est enregistré dans l'état global de
+    # pyplot, l'export peut donc tourner depuis un thread ou un processus de travail
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    plot_voronoi(points, ax, regions=regions)
+    ax.set_title(TITLE)
+    fig.savefig(f"{filename}.{format_type}", format=format_type, bbox_inches='tight')
+
+
+def _export_worker(points, regions, filename, format_type):
+    """
+    Exporte le diagramme depuis un processus séparé (voir VoronoiApp.export).
+
+    Les régions déjà calculées par l'application sont transmises : le processus
+    n'a plus qu'à dessiner (export_voronoi n'utilise que le backend Agg).
+    """
+    export_voronoi(points, filename, format_type, regions=regions)
 
 
 class VoronoiApp:
     """
-    Application Tkinter pour charger, générer et visualiser une approximation du diagramme de Voronoï.
+    Application Tkinter pour charger, générer et visualiser le diagramme de Voronoï
+    (exact avec scipy, approximé sinon).
     """
     def __init__(self, root):
         self.root = root
-        self.root.title("Approximation du Diagramme de Voronoï")
+        self.root.title(TITLE)
         self.points = None
+        # Régions calculées et empreinte des points correspondants (voir _regions)
+        self._cached_regions = None
+        self._points_key = None
+        # Figure affichée, créée au premier tracé puis réutilisée
+        self.fig = None
+        self.ax = None
+        self.canvas = None
+        # Processus d'export, démarré au premier export
+        self._executor = None
 
         # Widgets
         self.load_button = tk.Button(root, text="Charger Fichier", command=self.load_file)
@@ -207,35 +336,61 @@ class VoronoiApp:
                 self.error_label.config(text=str(e))
                 self.generate_button.config(state=tk.DISABLED)
 
+    def _regions(self):
+        """Retourne les régions des points courants, calculées une seule fois par jeu de points."""
+        key = self.points.tobytes()
+        if key != self._points_key:
+            self._cached_regions = compute_regions(self.points)
+            self._points_key = key
+        return self._cached_regions
+
     def generate_and_plot(self):
-        """Génère l'approximation et l'affiche dans le canvas Tkinter."""
+        """Génère le diagramme et l'affiche dans le canvas Tkinter."""
         if self.points is not None:
-            fig, ax = plt.subplots(figsize=(6, 6))
-            plot_voronoi(self.points, ax)
-            ax.set_title("Approximation du Diagramme de Voronoï")
-
-            # Intégrer dans Tkinter
-            for widget in self.canvas_frame.winfo_children():
-                widget.destroy()
-            canvas = FigureCanvasTkAgg(fig, master=self.canvas_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            if self.fig is None:
+                # Une seule figure pour toute la session : pyplot garde une
+                # référence à chaque figure créée, qui ne serait jamais libérée
+                self.fig, self.ax = plt.subplots(figsize=(6, 6))
+                self.canvas = FigureCanvasTkAgg(self.fig, master=self.canvas_frame)
+                self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            else:
+                self.ax.clear()
+            plot_voronoi(self.points, self.ax, regions=self._regions())
+            self.ax.set_title(TITLE)
+            self.canvas.draw()
 
             self.export_svg_button.config(state=tk.NORMAL)
             self.export_png_button.config(state=tk.NORMAL)
             self.error_label.config(text="")
 
     def export(self, format_type):
-        """Exporte l'approximation dans le format spécifié."""
+        """
+        Exporte le diagramme dans le format spécifié.
+
+        Le rendu est fait dans un processus séparé : l'interface reste réactive
+        pendant l'export, et plusieurs exports peuvent s'enchaîner.
+        """
         if self.points is not None:
             filename = filedialog.asksaveasfilename(defaultextension=f".{format_type}", filetypes=[(f"Fichiers {format_type.upper()}", f"*.{format_type}")])
             if filename:
-                try:
-                    export_voronoi(self.points, filename, format_type)
-                    messagebox.showinfo("Succès", f"Exporté en {format_type.upper()} : {filename}.{format_type}")
-                except Exception as e:
-                    messagebox.showerror("Erreur", f"Échec de l'export : {str(e)}")
-
+                if self._executor is None:
+                    # 'spawn' : le processus fils ne reprend pas l'état Tk du processus principal
+                    self._executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+                future = self._executor.submit(_export_worker, self.points, self._regions(), filename, format_type)
+                self._poll_export(future, filename, format_type)
+
+    def _poll_export(self, future, filename, format_type):
+        """Attend la fin d'un export sans bloquer la boucle Tk, puis affiche le résultat."""
+        if not future.done():
+            # Tk n'est pas thread-safe : on interroge depuis la boucle Tk plutôt
+            # que d'être rappelé depuis le thread de l'executor
+            self.root.after(100, self._poll_export, future, filename, format_type)
+            return
+        try:
+            future.result()
+            messagebox.showinfo("Succès", f"Exporté en {format_type.upper()} : {filename}.{format_type}")
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Échec de l'export : {str(e)}")
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -0,0 +1,34 @@
+"""
+Compilation à l'avance (AOT) des noyaux numba de voronoi_app.
+
+À lancer une seule fois, avec numba installé : python build_aot.py
+Le module voronoi_aot est créé à côté de voronoi_app.py. L'application
+l'utilise lorsque numba n'est pas disponible : la grille reste calculée
+par du code machine, sans dépendre de numba ni attendre de compilation.
+"""
+
+import os
+
+import voronoi_app
+
+if not voronoi_app.NUMBA_DISPONIBLE:
+    raise SystemExit("numba n'est pas installé, impossible de compiler le module.")
+
+from numba.pycc import CC
+
+cc = CC('voronoi_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+# Instructions du processeur de la machine (AVX...) : sans cela, les boucles
+# ne sont pas vectorisées et le module est environ dix fois plus lent
+cc.target_cpu = 'host'
+
+# Mêmes noyaux que la version JIT (py_func : la fonction Python d'origine),
+# une version par type de grille (voir _type_grille) : uint8, uint16, int32
+for suffixe in ('u1', 'u2', 'i4'):
+    signature = f'void(f4[::1], f4[::1], {suffixe}[:, ::1])'
+    cc.export(f'rasteriser_{suffixe}', signature)(voronoi_app._rasteriser.py_func)
+    cc.export(f'rasteriser_tries_{suffixe}', signature)(voronoi_app._rasteriser_tries.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
+    print("✓ Module voronoi_aot compilé.")
@@ -10,12 +10,15 @@ import tempfile
 import numpy as np
 import pytest
 
+import voronoi_app
 from voronoi_app import (
     lire_coordonnees,
     calculer_distance,
     trouver_site_le_plus_proche,
     normaliser_points,
     generer_grille_voronoi,
+    calculer_regions_voronoi,
+    exporter_grille_png,
 )
 
 
@@ -177,6 +180,13 @@ class TestTrouverSiteLePlusProche:
         index = trouver_site_le_plus_proche(5, 5, points_simples)
         assert 0 <= index < len(points_simples)
 
+    def test_tableau_de_pixels(self, points_simples):
+        """Avec des tableaux de pixels, retourne un index par pixel."""
+        xs = np.array([1, 9, 1, 9])
+        ys = np.array([1, 1, 9, 9])
+        index = trouver_site_le_plus_proche(xs, ys, points_simples)
+        assert index.tolist() == [0, 1, 2, 3]
+
 
 # ─────────────────────────────────────────────
 # Tests : normaliser_points
@@ -217,6 +227,13 @@ class TestNormaliserPoints:
             assert normalises[i][0] < normalises[i + 1][0]
             assert normalises[i][1] < normalises[i + 1][1]
 
+    def test_tableau_float32(self, points_simples):
+        """Le résultat est un tableau float32 (n, 2), qu'on passe une liste ou un tableau."""
+        normalises = normaliser_points(points_simples)
+        assert normalises.dtype == np.float32
+        assert normalises.shape == (len(points_simples), 2)
+        np.testing.assert_array_equal(normaliser_points(np.array(points_simples)), normalises)
+
 
 # ─────────────────────────────────────────────
 # Tests : generer_grille_voronoi
@@ -250,3 +267,126 @@ class TestGenererGrilleVoronoi:
         points = [(10.0, 10.0), (40.0, 40.0)]
         grille = generer_grille_voronoi(points, largeur=50, hauteur=50)
         assert isinstance(grille, np.ndarray)
+
+    def test_type_entier_minimal(self):
+        """La grille utilise le plus petit type entier qui contient tous les index."""
+        points = [(10.0, 10.0), (40.0, 40.0)]
+        assert generer_grille_voronoi(points, largeur=20, hauteur=20).dtype == np.uint8
+        points = [tuple(p) for p in np.random.default_rng(0).uniform(0, 30, size=(300, 2))]
+        grille = generer_grille_voronoi(points, largeur=30, hauteur=30)
+        assert grille.dtype == np.uint16
+        assert grille.max() > 255
+
+    def test_numba_identique_a_numpy(self, monkeypatch):
+        """Le noyau numba et le calcul numpy doivent donner la même grille."""
+        pytest.importorskip("numba")
+        points = [tuple(p) for p in np.random.default_rng(0).uniform(0, 60, size=(30, 2))]
+        grille_numba = generer_grille_voronoi(points, largeur=60, hauteur=50)
+
+        monkeypatch.setattr(voronoi_app, "NUMBA_DISPONIBLE", False)
+        monkeypatch.setattr(voronoi_app, "voronoi_aot", None)
+        monkeypatch.setattr(voronoi_app, "SCIPY_DISPONIBLE", False)
+        grille_numpy = generer_grille_voronoi(points, largeur=60, hauteur=50)
+
+        assert np.array_equal(grille_numba, grille_numpy)
+
+    def test_arbre_kd_identique_a_numpy(self, monkeypatch):
+        """Sans numba, l'arbre k-d de scipy doit donner la même grille que numpy."""
+        pytest.importorskip("scipy")
+        points = [tuple(p) for p in np.random.default_rng(2).uniform(0, 60, size=(40, 2))]
+        monkeypatch.setattr(voronoi_app, "NUMBA_DISPONIBLE", False)
+        monkeypatch.setattr(voronoi_app, "voronoi_aot", None)
+        monkeypatch.setattr(voronoi_app, "SEUIL_KDTREE", 0)
+        grille_kd = generer_grille_voronoi(points, largeur=60, hauteur=50)
+
+        monkeypatch.setattr(voronoi_app, "SCIPY_DISPONIBLE", False)
+        grille_numpy = generer_grille_voronoi(points, largeur=60, hauteur=50)
+
+        assert np.array_equal(grille_kd, grille_numpy)
+
+    def test_module_aot_identique_a_numpy(self, monkeypatch):
+        """Les noyaux compilés à l'avance (build_aot.py) doivent donner la même grille."""
+        pytest.importorskip("voronoi_aot")
+        points = [tuple(p) for p in np.random.default_rng(4).uniform(0, 60, size=(40, 2))]
+        points += [points[5]]
+        monkeypatch.setattr(voronoi_app, "NUMBA_DISPONIBLE", False)
+        monkeypatch.setattr(voronoi_app, "SCIPY_DISPONIBLE", False)
+        grille_aot = generer_grille_voronoi(points, largeur=60, hauteur=50)
+        monkeypatch.setattr(voronoi_app, "SEUIL_SITES_TRIES", 0)
+        grille_aot_tries = generer_grille_voronoi(points, largeur=60, hauteur=50)
+
+        monkeypatch.setattr(voronoi_app, "voronoi_aot", None)
+        grille_numpy = generer_grille_voronoi(points, largeur=60, hauteur=50)
+
+        assert np.array_equal(grille_aot, grille_numpy)
+        assert np.array_equal(grille_aot_tries, grille_numpy)
+
+    def test_noyau_sites_tries_identique_a_numpy(self, monkeypatch):
+        """Le noyau à sites triés doit donner la même grille, doublons compris."""
+        pytest.importorskip("numba")
+        points = [tuple(p) for p in np.random.default_rng(1).uniform(0, 60, size=(40, 2))]
+        points += [points[3], (10.0, 10.0), (10.0, 10.0)]
+        monkeypatch.setattr(voronoi_app, "SEUIL_SITES_TRIES", 0)
+        grille_tries = generer_grille_voronoi(points, largeur=60, hauteur=50)
+
+        monkeypatch.setattr(voronoi_app, "NUMBA_DISPONIBLE", False)
+        monkeypatch.setattr(voronoi_app, "voronoi_aot", None)
+        monkeypatch.setattr(voronoi_app, "SCIPY_DISPONIBLE", False)
+        grille_numpy = generer_grille_voronoi(points, largeur=60, hauteur=50)
+
+        assert np.array_equal(grille_tries, grille_numpy)
+
+
+# ─────────────────────────────────────────────
+# Tests : calculer_regions_voronoi
+# ─────────────────────────────────────────────
+
+class TestCalculerRegionsVoronoi:
+    """Tests pour la fonction calculer_regions_voronoi."""
+
+    def test_cellules_comme_la_grille(self):
+        """Les centres des pixels d'une cellule sont attribués à son site dans la grille."""
+        pytest.importorskip("scipy")
+        from matplotlib.path import Path
+        points = [tuple(p) for p in np.random.default_rng(3).uniform(2, 48, size=(25, 2))]
+        regions = calculer_regions_voronoi(points, largeur=60, hauteur=50)
+        grille = generer_grille_voronoi(points, largeur=60, hauteur=50)
+
+        pixels_x, pixels_y = np.meshgrid(np.arange(60), np.arange(50))
+        centres = np.column_stack([pixels_x.ravel(), pixels_y.ravel()])
+        etiquettes = np.full(len(centres), -1)
+        for i, region in enumerate(regions):
+            etiquettes[Path(region).contains_points(centres)] = i
+
+        # Seuls quelques pixels exactement sur une frontière peuvent différer
+        assert np.mean(etiquettes == grille.ravel()) > 0.99
+
+    def test_sites_confondus(self):
+        """Pour deux sites confondus, seul le premier a une cellule."""
+        pytest.importorskip("scipy")
+        points = [(10.0, 10.0), (40.0, 30.0), (10.0, 10.0)]
+        regions = calculer_regions_voronoi(points, largeur=50, hauteur=40)
+        assert len(regions[0]) > 0
+        assert len(regions[2]) == 0
+
+
+# ─────────────────────────────────────────────
+# Tests : exporter_grille_png
+# ─────────────────────────────────────────────
+
+class TestExporterGrillePng:
+    """Tests pour la fonction exporter_grille_png."""
+
+    def test_image_indexee(self, tmp_path):
+        """Le PNG doit avoir un pixel par case et une couleur par zone."""
+        from PIL import Image
+        points = [(5.0, 25.0), (45.0, 25.0), (25.0, 45.0)]
+        grille = generer_grille_voronoi(points, largeur=50, hauteur=40)
+        chemin = tmp_path / "grille.png"
+        exporter_grille_png(grille, str(chemin))
+
+        image = Image.open(chemin)
+        assert image.mode == 'P'
+        assert image.size == (50, 40)
+        # Lignes retournées : la première ligne de l'image est la dernière de la grille
+        assert np.array_equal(np.asarray(image), np.flipud(grille))
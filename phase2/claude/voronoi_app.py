@@ -4,11 +4,52 @@ Phase 2 - SAÉ S6
 """
 
 import math
+import threading
+import warnings
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.backends.backend_tkagg as tkagg
+from matplotlib.collections import PolyCollection
+from PIL import Image
+
+# Numba est optionnel : il compile la recherche du site le plus proche en
+# code machine parallèle. Sans lui, le calcul est fait par blocs numpy.
+try:
+    from numba import get_num_threads, njit, prange
+    NUMBA_DISPONIBLE = True
+except ImportError:
+    NUMBA_DISPONIBLE = False
+
+# Version des noyaux compilée à l'avance (créée par build_aot.py) : sans
+# numba, la recherche du site le plus proche reste du code machine.
+try:
+    import voronoi_aot
+except ImportError:
+    voronoi_aot = None
+
+# Scipy est optionnel : il donne les cellules exactes du diagramme pour
+# l'affichage et, sans numba, son arbre k-d remplace le calcul numpy
+# lorsque les sites sont nombreux (voir SEUIL_KDTREE).
+try:
+    from scipy.spatial import Voronoi, cKDTree
+    SCIPY_DISPONIBLE = True
+except ImportError:
+    SCIPY_DISPONIBLE = False
+
+# Nombre maximal de distances calculées en un seul bloc (~1 Mo en float32) :
+# le bloc reste dans le cache L2 entre son calcul et sa réduction par argmin
+TAILLE_MAX_BLOC = 256 * 1024
+
+# À partir de ce nombre de sites, le noyau numba qui trie les sites par x et
+# élague les sites trop éloignés en x l'emporte sur le balayage vectorisé
+# de tous les sites (mesuré sur une grille 500 x 500)
+SEUIL_SITES_TRIES = 4000
+
+# Sans numba, à partir de ce nombre de sites, interroger un arbre k-d
+# (O(log n) par pixel) est plus rapide que comparer chaque pixel à tous les sites
+SEUIL_KDTREE = 600
 
 
 # ─────────────────────────────────────────────
@@ -34,6 +75,61 @@ def lire_coordonnees(nom_fichier: str) -> list[tuple[float, float]]:
         FileNotFoundError: Si le fichier n'existe pas.
         ValueError: Si le fichier contient moins de 2 points valides.
     """
+    # Deux colonnes converties d'un bloc puis appariées : bien plus rapide
+    # que de construire chaque tuple depuis une ligne du tableau
+    xs, ys = _lire_tableau_coordonnees(nom_fichier).T.tolist()
+    return list(zip(xs, ys))
+
+
+def _lire_tableau_coordonnees(nom_fichier: str) -> np.ndarray:
+    """
+    Lit le fichier de points directement en tableau numpy (n, 2).
+
+    Même format et mêmes erreurs que lire_coordonnees, mais sans passer par
+    une liste de tuples : l'application garde ce tableau pour tous ses calculs.
+
+    Args:
+        nom_fichier: Chemin vers le fichier à lire.
+
+    Returns:
+        Tableau float64 (n, 2) des points, une ligne par point.
+    """
+    # Lecture rapide en C par numpy ; si le fichier n'est pas parfaitement
+    # régulier, la lecture ligne par ligne indique la ligne fautive.
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # numpy avertit quand le fichier est vide
+            tableau = np.loadtxt(nom_fichier, delimiter=',', comments=None,
+                                 ndmin=2, encoding='utf-8')
+    except ValueError:
+        tableau = None
+
+    if tableau is None or tableau.shape[1] != 2:
+        tableau = np.array(_lire_coordonnees_ligne_par_ligne(nom_fichier),
+                           dtype=np.float64).reshape(-1, 2)
+
+    if len(tableau) < 2:
+        raise ValueError(
+            f"Le fichier doit contenir au moins 2 points. "
+            f"Seulement {len(tableau)} point(s) trouvé(s)."
+        )
+
+    return tableau
+
+
+def _lire_coordonnees_ligne_par_ligne(nom_fichier: str) -> list[tuple[float, float]]:
+    """
+    Lit le fichier ligne par ligne, en signalant précisément la première ligne invalide.
+
+    Args:
+        nom_fichier: Chemin vers le fichier à lire.
+
+    Returns:
+        Liste de tuples (x, y) en float.
+
+    Raises:
+        ValueError: Si une ligne est mal formatée.
+    """
     points = []
 
     with open(nom_fichier, 'r', encoding='utf-8') as fichier:
@@ -57,12 +153,6 @@ def lire_coordonnees(nom_fichier: str) -> list[tuple[float, float]]:
                 )
             points.append((x, y))
 
-    if len(points) < 2:
-        raise ValueError(
-            f"Le fichier doit contenir au moins 2 points. "
-            f"Seulement {len(points)} point(s) trouvé(s)."
-        )
-
     return points
 
 
@@ -84,81 +174,233 @@ def calculer_distance(point1: tuple[float, float],
     """
     x1, y1 = point1
     x2, y2 = point2
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    # Un seul appel en C, sans dépassement intermédiaire pour les grandes valeurs
+    return math.hypot(x2 - x1, y2 - y1)
 
 
-def trouver_site_le_plus_proche(pixel_x: float,
-                                pixel_y: float,
-                                liste_points: list[tuple[float, float]]) -> int:
+def trouver_site_le_plus_proche(pixel_x: float | np.ndarray,
+                                pixel_y: float | np.ndarray,
+                                liste_points: list[tuple[float, float]] | np.ndarray
+                                ) -> int | np.ndarray:
     """
-    Retourne l'index du site le plus proche d'un pixel donné.
+    Retourne l'index du site le plus proche d'un pixel (ou d'un tableau de pixels).
+
+    Toutes les distances sont calculées d'un seul coup par numpy
+    (diffusion sur un axe supplémentaire pour les sites), puis réduites
+    par argmin. Le carré de la distance suffit pour comparer : la racine
+    carrée est inutile.
 
     Args:
-        pixel_x: Coordonnée x du pixel.
-        pixel_y: Coordonnée y du pixel.
-        liste_points: Liste des sites (points germes).
+        pixel_x: Coordonnée x du pixel (nombre ou tableau numpy).
+        pixel_y: Coordonnée y du pixel (nombre ou tableau numpy).
+        liste_points: Sites (points germes), liste de tuples ou tableau (n, 2).
 
     Returns:
-        Index (int) du site le plus proche dans liste_points.
+        Index (int) du site le plus proche dans liste_points, ou tableau
+        d'index de la forme des pixels si des tableaux sont fournis.
+    """
+    sites = np.asarray(liste_points)
+    if sites.dtype.kind != 'f':
+        sites = sites.astype(np.float64)
+    index = _site_le_plus_proche(pixel_x, pixel_y, *_colonnes_sites(sites))
+
+    if index.ndim == 0:
+        return int(index)
+    return index
+
+
+def _colonnes_sites(sites: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sépare un tableau (n, 2) de sites en deux tableaux contigus (xs, ys).
+
+    Les calculs lisent les x et les y séparément : dans le tableau (n, 2),
+    chaque lecture d'une coordonnée ramène aussi l'autre dans le cache,
+    alors que deux colonnes contiguës se lisent d'un bloc (et en SIMD).
     """
-    distance_min = float('inf')
-    index_plus_proche = 0
+    return np.ascontiguousarray(sites[:, 0]), np.ascontiguousarray(sites[:, 1])
 
-    for index, point in enumerate(liste_points):
-        distance = calculer_distance((pixel_x, pixel_y), point)
-        if distance < distance_min:
-            distance_min = distance
-            index_plus_proche = index
 
-    return index_plus_proche
+def _site_le_plus_proche(pixel_x, pixel_y, sites_x: np.ndarray,
+                         sites_y: np.ndarray) -> np.ndarray:
+    """Index du site le plus proche de chaque pixel, les sites étant donnés en colonnes."""
+    # Les pixels sont convertis dans le même type flottant que les sites
+    dx = np.asarray(pixel_x, dtype=sites_x.dtype)[..., None] - sites_x
+    dy = np.asarray(pixel_y, dtype=sites_y.dtype)[..., None] - sites_y
+    return (dx * dx + dy * dy).argmin(axis=-1)
 
 
 # ─────────────────────────────────────────────
 # 3. Normalisation des points
 # ─────────────────────────────────────────────
 
-def normaliser_points(points: list[tuple[float, float]],
+def normaliser_points(points: list[tuple[float, float]] | np.ndarray,
                       largeur: int = 500,
                       hauteur: int = 500,
-                      marge: int = 30) -> list[tuple[float, float]]:
+                      marge: int = 30) -> np.ndarray:
     """
     Normalise les points pour les adapter à la taille de la grille.
 
     Recentre les points en soustrayant les minimums, puis les étire
     pour occuper toute la surface disponible en respectant une marge.
+    Le calcul est fait sur tout le tableau à la fois, en float64 comme les
+    coordonnées lues ; le résultat est rendu en float32, le type attendu
+    par generer_grille_voronoi.
 
     Args:
-        points: Liste de points bruts.
+        points: Points bruts, liste de tuples ou tableau (n, 2).
         largeur: Largeur de la grille en pixels.
         hauteur: Hauteur de la grille en pixels.
         marge: Marge en pixels autour des bords.
 
     Returns:
-        Liste de points normalisés.
+        Tableau float32 (n, 2) des points normalisés.
     """
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-
-    x_min, x_max = min(xs), max(xs)
-    y_min, y_max = min(ys), max(ys)
+    points = np.asarray(points, dtype=np.float64)
+    minimums = points.min(axis=0)
+    plages = points.max(axis=0) - minimums
 
     # Éviter la division par zéro si tous les points ont la même coordonnée
-    plage_x = x_max - x_min if x_max != x_min else 1.0
-    plage_y = y_max - y_min if y_max != y_min else 1.0
-
-    points_normalises = []
-    for px, py in points:
-        nx = marge + (px - x_min) / plage_x * (largeur - 2 * marge)
-        ny = marge + (py - y_min) / plage_y * (hauteur - 2 * marge)
-        points_normalises.append((nx, ny))
+    plages[plages == 0] = 1.0
 
-    return points_normalises
+    tailles = np.array([largeur - 2 * marge, hauteur - 2 * marge], dtype=np.float64)
+    return (marge + (points - minimums) / plages * tailles).astype(np.float32)
 
 
 # ─────────────────────────────────────────────
 # 4. Génération de la grille Voronoï
 # ─────────────────────────────────────────────
 
+if NUMBA_DISPONIBLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _rasteriser(px, py, grille):
+        """
+        Noyau compilé : index du site le plus proche pour chaque pixel.
+
+        Les lignes sont réparties sur les cœurs (prange). Pour chaque ligne,
+        les sites sont balayés un par un en mettant à jour les meilleures
+        distances de toute la ligne : la boucle interne sur des pixels
+        contigus est vectorisable (SIMD). Seule une ligne de distances est
+        allouée, quel que soit le nombre de sites. Le résultat est écrit
+        dans grille, déjà allouée au type voulu.
+        """
+        hauteur, largeur = grille.shape
+        xs = np.arange(largeur).astype(np.float32)
+        for y in prange(hauteur):
+            meilleures = np.empty(largeur, dtype=np.float32)
+            index = np.zeros(largeur, dtype=np.int32)
+
+            # Initialisation avec le premier site (pas d'infini avec fastmath)
+            dy = np.float32(y) - py[0]
+            dy2 = dy * dy
+            for x in range(largeur):
+                dx = xs[x] - px[0]
+                meilleures[x] = dx * dx + dy2
+
+            for k in range(1, px.shape[0]):
+                dy = np.float32(y) - py[k]
+                dy2 = dy * dy
+                for x in range(largeur):
+                    dx = xs[x] - px[k]
+                    d = dx * dx + dy2
+                    if d < meilleures[x]:
+                        meilleures[x] = d
+                        index[x] = k
+
+            grille[y] = index
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _rasteriser_tries(px, py, grille):
+        """
+        Noyau compilé pour un grand nombre de sites (voir SEUIL_SITES_TRIES).
+
+        Les sites sont triés par x. Pour chaque pixel, la recherche part du
+        premier site d'abscisse >= x et s'en éloigne à gauche puis à droite ;
+        dès que dx² dépasse la meilleure distance, les sites suivants de ce
+        côté ne peuvent pas être plus proches et sont ignorés. À distance
+        égale, le plus petit index l'emporte, comme dans _rasteriser.
+        """
+        hauteur, largeur = grille.shape
+        n = px.shape[0]
+        ordre = np.argsort(px).astype(np.int32)
+        sx = px[ordre]
+        sy = py[ordre]
+        for y in prange(hauteur):
+            fy = np.float32(y)
+            p = 0  # premier site d'abscisse >= x, il ne fait qu'avancer sur la ligne
+            for x in range(largeur):
+                fx = np.float32(x)
+                while p < n - 1 and sx[p] < fx:
+                    p += 1
+                dx = fx - sx[p]
+                dy = fy - sy[p]
+                meilleure = dx * dx + dy * dy
+                index = ordre[p]
+
+                k = p - 1
+                while k >= 0:
+                    dx = fx - sx[k]
+                    if dx * dx > meilleure:
+                        break
+                    dy = fy - sy[k]
+                    d = dx * dx + dy * dy
+                    if d < meilleure or (d == meilleure and ordre[k] < index):
+                        meilleure = d
+                        index = ordre[k]
+                    k -= 1
+
+                k = p + 1
+                while k < n:
+                    dx = fx - sx[k]
+                    if dx * dx > meilleure:
+                        break
+                    dy = fy - sy[k]
+                    d = dx * dx + dy * dy
+                    if d < meilleure or (d == meilleure and ordre[k] < index):
+                        meilleure = d
+                        index = ordre[k]
+                    k += 1
+
+                grille[y, x] = index
+
+
+def _prechauffer_noyau() -> None:
+    """
+    Lance la compilation du noyau numba dans un thread en arrière-plan.
+
+    La première compilation prend quelques secondes (moins d'une lorsque le
+    cache disque de numba est déjà rempli) : lancée au démarrage, elle a lieu
+    pendant que l'utilisateur choisit son fichier plutôt qu'au premier clic
+    sur « Générer ». La signature est celle des appels de
+    generer_grille_voronoi jusqu'à 256 sites (grille uint8) : la version
+    compilée est réutilisée.
+
+    À appeler depuis le thread principal : les threads de calcul de numba y
+    sont démarrés avant la compilation, sans quoi la couche de threads (TBB)
+    initialisée depuis un autre thread peut bloquer la fermeture du programme.
+    """
+    if NUMBA_DISPONIBLE:
+        get_num_threads()
+        threading.Thread(
+            target=_rasteriser.compile,
+            args=('(float32[::1], float32[::1], uint8[:, ::1])',),
+            daemon=True
+        ).start()
+
+
+def _type_grille(nb_sites: int) -> type:
+    """
+    Plus petit type entier capable de stocker les index de nb_sites sites.
+
+    Un octet par pixel jusqu'à 256 sites (deux jusqu'à 65 536) au lieu de
+    quatre : la grille est plus légère à remplir, copier et afficher.
+    """
+    if nb_sites <= 256:
+        return np.uint8
+    if nb_sites <= 65536:
+        return np.uint16
+    return np.int32
+
+
 def generer_grille_voronoi(points: list[tuple[float, float]],
                            largeur: int = 500,
                            hauteur: int = 500) -> np.ndarray:
@@ -167,6 +409,9 @@ def generer_grille_voronoi(points: list[tuple[float, float]],
 
     Pour chaque pixel de la grille, détermine quel site est le plus
     proche et stocke son index. Complexité : O(largeur × hauteur × n).
+    Le calcul est fait par un noyau compilé avec numba s'il est installé,
+    sinon par sa version compilée à l'avance (build_aot.py) si elle existe,
+    sinon par un arbre k-d de scipy pour les nombreux sites, sinon par numpy.
 
     Args:
         points: Liste des sites (déjà normalisés).
@@ -175,41 +420,142 @@ def generer_grille_voronoi(points: list[tuple[float, float]],
 
     Returns:
         Tableau numpy 2D contenant l'index du site le plus proche
-        pour chaque pixel.
+        pour chaque pixel, du plus petit type entier suffisant (_type_grille).
     """
-    grille = np.zeros((hauteur, largeur), dtype=int)
-
-    for y in range(hauteur):
-        for x in range(largeur):
-            grille[y, x] = trouver_site_le_plus_proche(x, y, points)
+    # float32 : deux fois moins de mémoire parcourue, précision suffisante pour des pixels
+    sites_x, sites_y = _colonnes_sites(np.asarray(points, dtype=np.float32))
+
+    grille = np.empty((hauteur, largeur), dtype=_type_grille(len(sites_x)))
+
+    if NUMBA_DISPONIBLE:
+        if len(sites_x) >= SEUIL_SITES_TRIES:
+            _rasteriser_tries(sites_x, sites_y, grille)
+        else:
+            _rasteriser(sites_x, sites_y, grille)
+        return grille
+
+    if voronoi_aot is not None:
+        # Une fonction exportée par type de grille : suffixe u1, u2 ou i4
+        nom = 'rasteriser_tries' if len(sites_x) >= SEUIL_SITES_TRIES else 'rasteriser'
+        suffixe = f"{grille.dtype.kind}{grille.dtype.itemsize}"
+        getattr(voronoi_aot, f"{nom}_{suffixe}")(sites_x, sites_y, grille)
+        return grille
+
+    if SCIPY_DISPONIBLE and len(sites_x) >= SEUIL_KDTREE:
+        # Une seule requête pour tous les pixels, parcourus ligne par ligne.
+        # Seul cas où deux sites confondus peuvent donner l'autre index.
+        pixels_x, pixels_y = np.meshgrid(np.arange(largeur, dtype=np.float32),
+                                         np.arange(hauteur, dtype=np.float32))
+        arbre = cKDTree(np.column_stack([sites_x, sites_y]))
+        _, index = arbre.query(np.column_stack([pixels_x.ravel(), pixels_y.ravel()]),
+                               workers=-1)
+        grille[...] = index.reshape(hauteur, largeur)
+        return grille
+
+    # Distance au carré séparable : (x - sx)² ne dépend que de la colonne et
+    # (y - sy)² que de la ligne. Les deux tables (largeur x n et hauteur x n)
+    # sont calculées une fois ; chaque bloc de lignes se réduit alors à une
+    # addition diffusée suivie de l'argmin, tant que le bloc est en cache.
+    dx2 = (np.arange(largeur, dtype=np.float32)[:, None] - sites_x) ** 2
+    dy2 = (np.arange(hauteur, dtype=np.float32)[:, None] - sites_y) ** 2
+
+    lignes = max(1, TAILLE_MAX_BLOC // (largeur * len(sites_x)))
+    for y0 in range(0, hauteur, lignes):
+        grille[y0:y0 + lignes] = (dy2[y0:y0 + lignes, None, :] + dx2).argmin(axis=-1)
 
     return grille
 
 
+def calculer_regions_voronoi(points: list[tuple[float, float]] | np.ndarray,
+                             largeur: int = 500,
+                             hauteur: int = 500) -> list[np.ndarray]:
+    """
+    Calcule les cellules exactes du diagramme, découpées par le cadre de la grille.
+
+    Nécessite scipy. Les sites sont reflétés de l'autre côté des quatre bords
+    du cadre (celui de la grille affichée, de -0.5 à largeur - 0.5) : dans le
+    diagramme de ces 5n points, les cellules des sites d'origine sont fermées
+    et correspondent exactement à leur découpe par le cadre. Coût en
+    O(n log n), indépendant de la taille de la grille.
+
+    Args:
+        points: Sites (déjà normalisés), tous à l'intérieur du cadre.
+        largeur: Largeur de la grille.
+        hauteur: Hauteur de la grille.
+
+    Returns:
+        Sommets (m, 2) de la cellule de chaque site, dans l'ordre des sites.
+        Pour des sites confondus, seul le premier a une cellule (comme dans la
+        grille), les suivants ont un polygone vide.
+    """
+    sites = np.asarray(points, dtype=np.float64)
+    bords = ((-0.5, largeur - 0.5), (-0.5, hauteur - 0.5))
+
+    reflets = [sites]
+    for axe in (0, 1):
+        for bord in bords[axe]:
+            reflet = sites.copy()
+            reflet[:, axe] = 2 * bord - reflet[:, axe]
+            reflets.append(reflet)
+    diagramme = Voronoi(np.concatenate(reflets))
+
+    cellules = diagramme.point_region[:len(sites)]
+    _, premiers = np.unique(cellules, return_index=True)
+    regions = [np.empty((0, 2))] * len(sites)
+    for i in premiers:
+        regions[i] = diagramme.vertices[diagramme.regions[cellules[i]]]
+    return regions
+
+
 # ─────────────────────────────────────────────
 # 5. Affichage matplotlib
 # ─────────────────────────────────────────────
 
-def creer_figure_voronoi(points_originaux: list[tuple[float, float]],
+def creer_figure_voronoi(points_originaux: list[tuple[float, float]] | np.ndarray,
                          points_normalises: list[tuple[float, float]],
-                         grille: np.ndarray) -> plt.Figure:
+                         grille: np.ndarray | None,
+                         regions: list[np.ndarray] | None = None,
+                         fig: plt.Figure | None = None) -> plt.Figure:
     """
     Crée et retourne une figure matplotlib du diagramme de Voronoï.
 
+    Les cellules sont dessinées soit depuis la grille (image), soit depuis
+    leurs polygones exacts (calculer_regions_voronoi) : des formes vectorielles,
+    sans image de la taille de la grille à calculer ni à redimensionner.
+
     Args:
         points_originaux: Points d'origine (pour les labels).
         points_normalises: Points normalisés (pour l'affichage sur la grille).
-        grille: Grille Voronoï générée.
+        grille: Grille Voronoï générée, ou None si regions est fourni.
+        regions: Cellules du diagramme, utilisées à la place de la grille.
+        fig: Figure déjà créée par un appel précédent : ses axes sont vidés
+            et réutilisés au lieu de créer une nouvelle figure.
 
     Returns:
         Objet Figure matplotlib.
     """
-    fig, ax = plt.subplots(figsize=(7, 7))
-
-    ax.imshow(grille, origin='lower', cmap='tab20')
+    if fig is None:
+        fig, ax = plt.subplots(figsize=(7, 7))
+    else:
+        ax = fig.axes[0]
+        ax.clear()
+
+    if grille is not None:
+        ax.imshow(grille, origin='lower', cmap='tab20')
+    else:
+        # Mêmes couleurs que l'image : index des sites normalisés sur tab20
+        ax.add_collection(PolyCollection(
+            regions, array=np.arange(len(regions)), cmap='tab20', edgecolors='face'
+        ))
+        ax.margins(0)
+        ax.autoscale_view()
+        ax.set_aspect('equal')
+
+    # Un seul nuage de points (une collection) plutôt qu'un scatter par site
+    sites = np.asarray(points_normalises)
+    ax.scatter(sites[:, 0], sites[:, 1], color='red', s=60, zorder=5)
 
     for i, (px, py) in enumerate(points_normalises):
-        ax.scatter(px, py, color='red', s=60, zorder=5)
         ox, oy = points_originaux[i]
         ax.annotate(
             f"({ox}, {oy})",
@@ -253,6 +599,35 @@ def exporter_svg(fig: plt.Figure, chemin: str) -> None:
     fig.savefig(chemin, format='svg', bbox_inches='tight')
 
 
+def exporter_grille_png(grille: np.ndarray, chemin: str) -> None:
+    """
+    Exporte directement la grille Voronoï en image PNG, un pixel par case.
+
+    La grille d'indices est écrite telle quelle par Pillow avec une palette
+    (PNG indexé, 1 octet par pixel), sans passer par le rendu de matplotlib :
+    l'export est bien plus rapide et le fichier bien plus léger, mais sans
+    axes, titre ni points. Les couleurs sont celles de l'affichage (tab20).
+
+    Args:
+        grille: Grille Voronoï générée (index du site le plus proche).
+        chemin: Chemin de destination du fichier PNG.
+    """
+    # Même normalisation qu'imshow : de l'index minimal à l'index maximal
+    vmin, vmax = int(grille.min()), int(grille.max())
+    valeurs = np.arange(vmin, vmax + 1)
+    couleurs = plt.get_cmap('tab20')((valeurs - vmin) / max(vmax - vmin, 1))[:, :3]
+    couleurs = (couleurs * 255).round().astype(np.uint8)
+
+    # Origine en bas à gauche à l'affichage (origin='lower') : on retourne les lignes
+    indices = np.flipud(grille) - vmin
+    if len(valeurs) <= 256:
+        image = Image.fromarray(indices.astype(np.uint8), mode='P')
+        image.putpalette(couleurs.ravel().tolist())
+    else:
+        image = Image.fromarray(couleurs[indices])
+    image.save(chemin, format='PNG')
+
+
 # ─────────────────────────────────────────────
 # 7. Interface graphique Tkinter
 # ─────────────────────────────────────────────
@@ -270,17 +645,21 @@ class ApplicationVoronoi(tk.Tk):
         self.title("Diagramme de Voronoï - SAÉ S6")
         self.resizable(False, False)
 
-        self._points_originaux = []
+        # Points chargés, gardés en tableau (n, 2) pour tous les calculs
+        self._points_originaux = None
         self._points_normalises = []
         self._grille = None
         self._figure = None
 
         self._construire_interface()
 
+        # Compiler le noyau numba en arrière-plan, sans bloquer l'interface
+        _prechauffer_noyau()
+
         # Charger automatiquement points.txt
         try:
             chemin_points = "../../phase1/points.txt"
-            self._points_originaux = lire_coordonnees(chemin_points)
+            self._points_originaux = _lire_tableau_coordonnees(chemin_points)
             nom_court = chemin_points.split("/")[-1]
             self._label_fichier.config(
                 text=f"✔ {nom_court}\n({len(self._points_originaux)} points)",
@@ -339,6 +718,12 @@ class ApplicationVoronoi(tk.Tk):
             width=22, bg="#8e44ad", fg="white", relief=tk.FLAT
         ).pack(pady=5)
 
+        tk.Button(
+            panneau, text="💾 Exporter la grille (PNG)",
+            command=self._exporter_grille_png,
+            width=22, bg="#8e44ad", fg="white", relief=tk.FLAT
+        ).pack(pady=5)
+
         self._label_statut = tk.Label(
             panneau, text="", fg="#f0c040", bg="#2b2b2b", wraplength=160
         )
@@ -360,7 +745,7 @@ class ApplicationVoronoi(tk.Tk):
             return
 
         try:
-            self._points_originaux = lire_coordonnees(chemin)
+            self._points_originaux = _lire_tableau_coordonnees(chemin)
             nom_court = chemin.split("/")[-1]
             self._label_fichier.config(
                 text=f"✔ {nom_court}\n({len(self._points_originaux)} points)",
@@ -373,7 +758,7 @@ class ApplicationVoronoi(tk.Tk):
 
     def _generer(self) -> None:
         """Génère et affiche le diagramme de Voronoï."""
-        if not self._points_originaux:
+        if self._points_originaux is None:
             messagebox.showwarning("Aucun fichier", "Veuillez d'abord charger un fichier.")
             return
 
@@ -385,30 +770,47 @@ class ApplicationVoronoi(tk.Tk):
             largeur=self.LARGEUR_GRILLE,
             hauteur=self.HAUTEUR_GRILLE
         )
-        self._grille = generer_grille_voronoi(
-            self._points_normalises,
-            largeur=self.LARGEUR_GRILLE,
-            hauteur=self.HAUTEUR_GRILLE
-        )
-        self._figure = creer_figure_voronoi(
-            self._points_originaux,
-            self._points_normalises,
-            self._grille
-        )
+        if SCIPY_DISPONIBLE:
+            # Cellules exactes pour l'affichage ; la grille n'est calculée
+            # que si on l'exporte (voir _exporter_grille_png)
+            self._grille = None
+            self._figure = creer_figure_voronoi(
+                self._points_originaux,
+                self._points_normalises,
+                None,
+                calculer_regions_voronoi(
+                    self._points_normalises,
+                    largeur=self.LARGEUR_GRILLE,
+                    hauteur=self.HAUTEUR_GRILLE
+                ),
+                fig=self._figure
+            )
+        else:
+            self._grille = generer_grille_voronoi(
+                self._points_normalises,
+                largeur=self.LARGEUR_GRILLE,
+                hauteur=self.HAUTEUR_GRILLE
+            )
+            self._figure = creer_figure_voronoi(
+                self._points_originaux,
+                self._points_normalises,
+                self._grille,
+                fig=self._figure
+            )
 
         self._afficher_figure()
         self._label_statut.config(text="✔ Diagramme généré !")
 
     def _afficher_figure(self) -> None:
         """Intègre la figure matplotlib dans la fenêtre Tkinter."""
-        if self._canvas_tk:
-            self._canvas_tk.get_tk_widget().destroy()
-
-        self._canvas_tk = tkagg.FigureCanvasTkAgg(
-            self._figure, master=self._cadre_canvas
-        )
+        # La figure est réutilisée d'une génération à l'autre : le canvas Tk
+        # n'est créé qu'une fois, il suffit ensuite de le redessiner
+        if self._canvas_tk is None:
+            self._canvas_tk = tkagg.FigureCanvasTkAgg(
+                self._figure, master=self._cadre_canvas
+            )
+            self._canvas_tk.get_tk_widget().pack(expand=True, fill=tk.BOTH)
         self._canvas_tk.draw()
-        self._canvas_tk.get_tk_widget().pack(expand=True, fill=tk.BOTH)
 
     def _exporter_png(self) -> None:
         """Exporte le diagramme au format PNG."""
@@ -436,6 +838,25 @@ class ApplicationVoronoi(tk.Tk):
             exporter_svg(self._figure, chemin)
             messagebox.showinfo("Export réussi", f"SVG sauvegardé :\n{chemin}")
 
+    def _exporter_grille_png(self) -> None:
+        """Exporte la grille seule (sans axes ni points) au format PNG."""
+        if not self._figure:
+            messagebox.showwarning("Rien à exporter", "Générez d'abord le diagramme.")
+            return
+        chemin = filedialog.asksaveasfilename(
+            defaultextension=".png",
+            filetypes=[("PNG", "*.png")]
+        )
+        if chemin:
+            if self._grille is None:
+                self._grille = generer_grille_voronoi(
+                    self._points_normalises,
+                    largeur=self.LARGEUR_GRILLE,
+                    hauteur=self.HAUTEUR_GRILLE
+                )
+            exporter_grille_png(self._grille, chemin)
+            messagebox.showinfo("Export réussi", f"Grille sauvegardée :\n{chemin}")
+
 
 # ─────────────────────────────────────────────
 # Point d'entrée